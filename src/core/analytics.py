@@ -48,8 +48,24 @@ class Analytics:
                 (pd.to_datetime(filtered_assignments['assignment_date']).dt.date <= end_date)
             ]
         
+        # Drop categories emptied by filtering so counts and charts only show present values
+        filtered_members = self._drop_unused_categories(filtered_members)
+        filtered_operations = self._drop_unused_categories(filtered_operations)
+        filtered_assignments = self._drop_unused_categories(filtered_assignments)
+        
         return filtered_members, filtered_operations, filtered_assignments
     
+    def _drop_unused_categories(self, df):
+        """Remove categories that no longer appear in categorical columns"""
+        
+        categorical_cols = df.select_dtypes('category').columns
+        if len(categorical_cols) == 0:
+            return df
+        
+        return df.assign(**{
+            col: df[col].cat.remove_unused_categories() for col in categorical_cols
+        })
+    
     def calculate_kpis(self, members_df, operations_df, assignments_df):
         """Calculate key performance indicators"""
         
@@ -147,10 +163,10 @@ class Analytics:
         efficiency_metrics = {}
         
         # Success rate by operation type
-        efficiency_metrics['success_by_type'] = operations_df.groupby('operation_type')['success_rate'].mean().sort_values(ascending=False)
+        efficiency_metrics['success_by_type'] = operations_df.groupby('operation_type', observed=True)['success_rate'].mean().sort_values(ascending=False)
         
         # Resource utilization
-        efficiency_metrics['resource_utilization'] = operations_df.groupby('operation_type').agg({
+        efficiency_metrics['resource_utilization'] = operations_df.groupby('operation_type', observed=True).agg({
             'volunteers_assigned': 'mean',
             'duration_hours': 'mean',
             'budget_allocated': 'mean'
@@ -172,7 +188,7 @@ class Analytics:
         """Simple prediction model for volunteer needs"""
         
         # Calculate average volunteers needed per operation type
-        volunteer_needs = operations_df.groupby('operation_type').agg({
+        volunteer_needs = operations_df.groupby('operation_type', observed=True).agg({
             'volunteers_assigned': 'mean',
             'duration_hours': 'mean',
             'success_rate': 'mean'
@@ -205,8 +221,8 @@ class Analytics:
             insights.append(f"👴 Average member age is {avg_age:.1f} years - consider youth recruitment programs")
         
         # Operations insights
-        best_operation_type = operations_df.groupby('operation_type')['success_rate'].mean().idxmax()
-        best_success_rate = operations_df.groupby('operation_type')['success_rate'].mean().max()
+        best_operation_type = operations_df.groupby('operation_type', observed=True)['success_rate'].mean().idxmax()
+        best_success_rate = operations_df.groupby('operation_type', observed=True)['success_rate'].mean().max()
         insights.append(f"🎯 '{best_operation_type}' operations have the highest success rate at {best_success_rate:.1%}")
         
         # Performance insights
@@ -268,7 +284,7 @@ class Analytics:
         retention_metrics['service_statistics'] = service_dist
         
         # Retention by demographic
-        retention_by_demo = members_df.groupby(['age_group', 'gender'])['years_of_service'].mean().unstack()
+        retention_by_demo = members_df.groupby(['age_group', 'gender'], observed=True)['years_of_service'].mean().unstack()
         retention_metrics['retention_by_demographics'] = retention_by_demo.round(2)
         
         # Activity-based retention
@@ -149,7 +149,7 @@ class RELAChatbot:
         """Handle queries about average age"""
         members_df, _, _ = data
         avg_age = members_df["age"].mean()
-        age_by_state = members_df.groupby("state")["age"].mean().round(1)
+        age_by_state = members_df.groupby("state", observed=True)["age"].mean().round(1)
 
         return {
             "text": f"The average age of RELA members is **{avg_age:.1f} years**. Age varies by state with the youngest average in {age_by_state.idxmin()} ({age_by_state.min():.1f} years) and oldest in {age_by_state.idxmax()} ({age_by_state.max():.1f} years).",
@@ -193,7 +193,7 @@ class RELAChatbot:
         _, operations_df, _ = data
         success_rate = operations_df["success_rate"].mean()
         success_by_type = (
-            operations_df.groupby("operation_type")["success_rate"]
+            operations_df.groupby("operation_type", observed=True)["success_rate"]
             .mean()
             .sort_values(ascending=False)
         )
@@ -323,10 +323,14 @@ class RELAChatbot:
 
         # Operation insights
         best_op_type = (
-            operations_df.groupby("operation_type")["success_rate"].mean().idxmax()
+            operations_df.groupby("operation_type", observed=True)["success_rate"]
+            .mean()
+            .idxmax()
         )
         best_success = (
-            operations_df.groupby("operation_type")["success_rate"].mean().max()
+            operations_df.groupby("operation_type", observed=True)["success_rate"]
+            .mean()
+            .max()
         )
         insights.append(
             f"🎯 **Operations**: '{best_op_type}' operations show highest success rate ({best_success:.1%})"
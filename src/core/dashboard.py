@@ -684,7 +684,7 @@ class Dashboard:
         with col2:
             # Service vs rank analysis
             service_rank = (
-                members_df.groupby("rank")["years_of_service"]
+                members_df.groupby("rank", observed=True)["years_of_service"]
                 .mean()
                 .sort_values(ascending=False)
             )
@@ -942,7 +942,9 @@ class Dashboard:
         with col2:
             # Budget allocation
             budget_by_type = (
-                operations_df.groupby("operation_type")["budget_allocated"]
+                operations_df.groupby("operation_type", observed=True)[
+                    "budget_allocated"
+                ]
                 .mean()
                 .sort_values(ascending=False)
             )
@@ -1833,7 +1835,8 @@ class Dashboard:
                             [
                                 clean_operations["start_date"].dt.to_period("M"),
                                 "operation_type",
-                            ]
+                            ],
+                            observed=True,
                         )
                         .size()
                         .reset_index(name="count")
@@ -2458,7 +2461,8 @@ class Dashboard:
             # Group by year and operation type
             yearly_ops = (
                 operations_clean.groupby(
-                    [operations_clean["start_date"].dt.year, "operation_type"]
+                    [operations_clean["start_date"].dt.year, "operation_type"],
+                    observed=True,
                 )
                 .size()
                 .reset_index(name="count")
@@ -2493,7 +2497,7 @@ class Dashboard:
         )
 
         regional_stats = (
-            members_df.groupby("state")
+            members_df.groupby("state", observed=True)
             .agg(
                 {
                     "member_id": "count",
@@ -3,26 +3,90 @@ RELA Analytics Floating Chatbot
 Modern floating AI assistant with OpenAI integration
 """
 
-import streamlit as st
-import pandas as pd
+from __future__ import annotations
 
-try:
-    from openai import OpenAI
-except ImportError:
-    st.error(
-        "OpenAI package not found. Please install with: pip install openai>=1.55.0"
-    )
-    st.stop()
+import streamlit as st
 import os
+import re
+from functools import lru_cache
 from dotenv import load_dotenv
-from typing import Dict, List, Any, Optional
+from typing import TYPE_CHECKING, Dict, List, Any, Optional
 from datetime import datetime
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 # Load environment variables
 load_dotenv()
 
 from ..utils.translations import get_text
 
+# Maximum number of chat messages kept in session state per user
+MAX_CHAT_HISTORY = 20
+
+# Welcome banner markup, built once at import and filled in per language
+_WELCOME_BANNER_HTML = """
+<div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
+            color: white; padding: 15px; border-radius: 10px; margin-bottom: 15px;">
+    <h4 style="margin: 0; color: white;">{greeting}</h4>
+    <p style="margin: 5px 0 0 0; font-size: 14px; opacity: 0.9;">{prompt}</p>
+</div>
+"""
+
+# Dashboard summary sent to the model, filled from precomputed statistics
+_CONTEXT_TEMPLATE = """
+Current RELA Malaysia Analytics Dashboard Data Summary:
+- Total Members: {total_members:,}
+- Active Members: {active_members:,}
+- Inactive Members: {inactive_members:,}
+- Total Operations: {total_operations:,}
+- States Covered: {total_states}
+- Top State by Members: {top_state} ({top_state_count:,} members)
+
+Current page context: {page_context}
+"""
+
+
+# Marker line that opens each answer of a batched reply; unlike plain
+# numbering it cannot be confused with numbered lists inside an answer
+_ANSWER_MARKER = "### ANSWER {} ###"
+_ANSWER_MARKER_PATTERN = re.compile(
+    r"^[ \t]*###\s*ANSWER\s+(\d+)\s*###[ \t]*$", re.MULTILINE
+)
+
+
+def _split_batch_answers(response: str, count: int) -> Optional[List[str]]:
+    """Split a batched reply on its answer markers, or None if it is malformed"""
+    parts = _ANSWER_MARKER_PATTERN.split(response)
+    numbers = [int(number) for number in parts[1::2]]
+    answers = [text.strip() for text in parts[2::2]]
+    if numbers != list(range(1, count + 1)) or not all(answers):
+        return None
+    return answers
+
+
+# Prompt wording and fallback message per chat language
+_LANGUAGE_INSTRUCTIONS = {
+    "en": {
+        "greeting": "You are a helpful AI assistant for RELA Malaysia Analytics Dashboard.",
+        "response_language": "Respond in English",
+        "fallback": "I apologize, but I'm experiencing technical difficulties. Please try again later.",
+    },
+    "ms": {
+        "greeting": "Anda adalah pembantu AI yang berguna untuk Papan Pemuka Analitik RELA Malaysia.",
+        "response_language": "Respond in Bahasa Malaysia (Malay language)",
+        "fallback": "Maaf, saya mengalami kesulitan teknikal. Sila cuba lagi nanti.",
+    },
+}
+
+
+@lru_cache(maxsize=None)
+def _get_openai_client(api_key: str):
+    """Import OpenAI on first use and reuse one client per API key across reruns"""
+    from openai import OpenAI
+
+    return OpenAI(api_key=api_key)
+
 
 class FloatingChatbot:
     def __init__(self, language="en"):
@@ -37,7 +101,14 @@ class FloatingChatbot:
             return
 
         # Initialize OpenAI client
-        self.client = OpenAI(api_key=self.api_key)
+        try:
+            self.client = _get_openai_client(self.api_key)
+        except ImportError:
+            st.error(
+                "OpenAI package not found. Please install with: pip install openai>=1.55.0"
+            )
+            st.stop()
+        self.model = os.getenv("RELA_CHAT_MODEL", "gpt-4o-mini")
 
         # Initialize session state for chat
         if "chat_history" not in st.session_state:
@@ -46,74 +117,72 @@ class FloatingChatbot:
             st.session_state.chat_open = False
         if "current_page_context" not in st.session_state:
             st.session_state.current_page_context = ""
+        if "pending_questions" not in st.session_state:
+            st.session_state.pending_questions = []
 
     def update_language(self, language):
         """Update the chatbot language"""
         self.language = language
 
-    def get_ai_response(self, user_message: str, context: str) -> str:
+    def get_ai_response(
+        self, user_message: str, context: str, max_tokens: int = 350
+    ) -> str:
         """Get AI response using OpenAI API"""
         try:
-            # Language-specific instructions
-            language_instructions = {
-                "en": {
-                    "greeting": "You are a helpful AI assistant for RELA Malaysia Analytics Dashboard.",
-                    "response_language": "Respond in English",
-                    "fallback": "I apologize, but I'm experiencing technical difficulties. Please try again later.",
-                },
-                "ms": {
-                    "greeting": "Anda adalah pembantu AI yang berguna untuk Papan Pemuka Analitik RELA Malaysia.",
-                    "response_language": "Respond in Bahasa Malaysia (Malay language)",
-                    "fallback": "Maaf, saya mengalami kesulitan teknikal. Sila cuba lagi nanti.",
-                },
-            }
+            return self._request_completion(user_message, context, max_tokens)
+        except Exception as e:
+            return self._error_response(e)
 
-            lang_config = language_instructions.get(
-                self.language, language_instructions["en"]
-            )
+    def _language_config(self) -> Dict[str, str]:
+        """Prompt wording and fallback message for the current language"""
+        return _LANGUAGE_INSTRUCTIONS.get(self.language, _LANGUAGE_INSTRUCTIONS["en"])
 
-            system_prompt = f"""
-            {lang_config["greeting"]}
-            
-            IMPORTANT: {lang_config["response_language"]}. All responses must be in the same language as this instruction.
-            
-            Context about the current dashboard:
-            {context}
-            
-            Guidelines:
-            - Provide concise, helpful answers about RELA data and analytics
-            - Use specific numbers and statistics when available
-            - Suggest relevant dashboard sections if applicable
-            - Be professional and supportive
-            - If asked about trends, mention specific data points
-            - For complex queries, break down the analysis
-            - Keep responses under 250 words for better readability
-            - Always respond in the language specified above
-            
-            If responding in Bahasa Malaysia:
-            - Use proper Malay terminology for RELA operations
-            - "Members" = "Ahli", "Operations" = "Operasi", "Performance" = "Prestasi"
-            - "States" = "Negeri", "Active" = "Aktif", "Total" = "Jumlah"
-            - "Analytics" = "Analitik", "Dashboard" = "Papan Pemuka"
-            """
-
-            response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_message},
-                ],
-                max_tokens=350,
-                temperature=0.7,
-            )
+    def _error_response(self, error: Exception) -> str:
+        """Fallback message shown in place of an answer when a request fails"""
+        return f"{self._language_config()['fallback']} Error: {str(error)}"
 
-            return response.choices[0].message.content.strip()
+    def _request_completion(
+        self, user_message: str, context: str, max_tokens: int
+    ) -> str:
+        """Send one chat completion request, raising any API or connection error"""
+        lang_config = self._language_config()
+
+        system_prompt = f"""
+        {lang_config["greeting"]}
+        
+        IMPORTANT: {lang_config["response_language"]}. All responses must be in the same language as this instruction.
+        
+        Context about the current dashboard:
+        {context}
+        
+        Guidelines:
+        - Provide concise, helpful answers about RELA data and analytics
+        - Use specific numbers and statistics when available
+        - Suggest relevant dashboard sections if applicable
+        - Be professional and supportive
+        - If asked about trends, mention specific data points
+        - For complex queries, break down the analysis
+        - Keep responses under 250 words for better readability
+        - Always respond in the language specified above
+        
+        If responding in Bahasa Malaysia:
+        - Use proper Malay terminology for RELA operations
+        - "Members" = "Ahli", "Operations" = "Operasi", "Performance" = "Prestasi"
+        - "States" = "Negeri", "Active" = "Aktif", "Total" = "Jumlah"
+        - "Analytics" = "Analitik", "Dashboard" = "Papan Pemuka"
+        """
+
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_message},
+            ],
+            max_tokens=max_tokens,
+            temperature=0.7,
+        )
 
-        except Exception as e:
-            lang_config = language_instructions.get(
-                self.language, language_instructions["en"]
-            )
-            return f"{lang_config['fallback']} Error: {str(e)}"
+        return response.choices[0].message.content.strip()
 
     def render_floating_chatbot(
         self,
@@ -153,13 +222,18 @@ class FloatingChatbot:
             with st.expander("🤖 RELA Analytics Assistant", expanded=True):
                 # Welcome message
                 st.markdown(
-                    f"""
-                    <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
-                                color: white; padding: 15px; border-radius: 10px; margin-bottom: 15px;">
-                        <h4 style="margin: 0; color: white;">{get_text(lang, 'chatbot_greeting', '👋 Hi! I am your RELA Analytics Assistant')}</h4>
-                        <p style="margin: 5px 0 0 0; font-size: 14px; opacity: 0.9;">{get_text(lang, 'chatbot_prompt', 'Ask me anything about the dashboard data!')}</p>
-                    </div>
-                    """,
+                    _WELCOME_BANNER_HTML.format(
+                        greeting=get_text(
+                            lang,
+                            "chatbot_greeting",
+                            "👋 Hi! I am your RELA Analytics Assistant",
+                        ),
+                        prompt=get_text(
+                            lang,
+                            "chatbot_prompt",
+                            "Ask me anything about the dashboard data!",
+                        ),
+                    ),
                     unsafe_allow_html=True,
                 )
 
@@ -170,40 +244,35 @@ class FloatingChatbot:
 
                 col1, col2 = st.columns(2)
                 with col1:
-                    if st.button(
+                    # Callbacks queue the question so rapid clicks are not lost
+                    st.button(
                         get_text(lang, "key_metrics", "📊 Key Metrics"),
                         key="quick_metrics",
                         use_container_width=True,
-                    ):
-                        question_text = (
-                            "Show me the key metrics and statistics"
-                            if lang == "en"
-                            else "Tunjukkan saya metrik dan statistik utama"
-                        )
-                        self._process_quick_question(
-                            question_text,
-                            members_df,
-                            operations_df,
-                            assignments_df,
-                        )
+                        on_click=self._queue_question,
+                        args=(
+                            (
+                                "Show me the key metrics and statistics"
+                                if lang == "en"
+                                else "Tunjukkan saya metrik dan statistik utama"
+                            ),
+                        ),
+                    )
 
                 with col2:
-                    if st.button(
+                    st.button(
                         get_text(lang, "top_states", "🗺️ Top States"),
                         key="quick_states",
                         use_container_width=True,
-                    ):
-                        question_text = (
-                            "Which states have the most RELA members?"
-                            if lang == "en"
-                            else "Negeri mana yang mempunyai ahli RELA paling ramai?"
-                        )
-                        self._process_quick_question(
-                            question_text,
-                            members_df,
-                            operations_df,
-                            assignments_df,
-                        )
+                        on_click=self._queue_question,
+                        args=(
+                            (
+                                "Which states have the most RELA members?"
+                                if lang == "en"
+                                else "Negeri mana yang mempunyai ahli RELA paling ramai?"
+                            ),
+                        ),
+                    )
 
                 # Chat messages display
                 if st.session_state.chat_history:
@@ -214,32 +283,8 @@ class FloatingChatbot:
 
                     # Display last 6 messages to avoid clutter
                     for message in st.session_state.chat_history[-6:]:
-                        if message["role"] == "user":
-                            st.markdown(
-                                f"""
-                                <div style="text-align: right; margin: 10px 0;">
-                                    <div style="display: inline-block; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
-                                                color: white; padding: 10px 15px; border-radius: 15px 15px 5px 15px; 
-                                                max-width: 80%; font-size: 14px;">
-                                        <strong>{get_text(lang, 'you', 'You')}:</strong> {message["content"]}
-                                    </div>
-                                </div>
-                                """,
-                                unsafe_allow_html=True,
-                            )
-                        else:
-                            st.markdown(
-                                f"""
-                                <div style="margin: 10px 0;">
-                                    <div style="display: inline-block; background: #f8f9fa; color: #495057; 
-                                                border: 1px solid #e9ecef; padding: 10px 15px; 
-                                                border-radius: 15px 15px 15px 5px; max-width: 90%; font-size: 14px;">
-                                        <strong>{get_text(lang, 'assistant', '🤖 Assistant')}:</strong> {message["content"]}
-                                    </div>
-                                </div>
-                                """,
-                                unsafe_allow_html=True,
-                            )
+                        with st.chat_message(message["role"]):
+                            st.markdown(message["content"])
 
                 # Chat input
                 st.markdown("---")
@@ -278,23 +323,80 @@ class FloatingChatbot:
                             st.session_state.chat_open = False
                             st.rerun()
 
-                # Process chat message
+                # Queue chat message
                 if submit_button and user_input.strip():
-                    self._process_chat_message(
-                        user_input.strip(), members_df, operations_df, assignments_df
+                    self._queue_question(user_input.strip())
+
+                # Answer everything queued in this run with a single rerun
+                if st.session_state.pending_questions:
+                    self._process_pending_questions(
+                        members_df, operations_df, assignments_df
                     )
                     st.rerun()
 
-    def _process_quick_question(
+    def _queue_question(self, question: str):
+        """Queue a question to be answered on the next drain"""
+        st.session_state.pending_questions.append(question)
+
+    def _process_pending_questions(
         self,
-        question: str,
         members_df: pd.DataFrame,
         operations_df: pd.DataFrame,
         assignments_df: pd.DataFrame,
     ):
-        """Process a quick question button click"""
-        self._process_chat_message(question, members_df, operations_df, assignments_df)
-        st.rerun()
+        """Answer all queued questions, batching them into one API call"""
+        questions = []
+        for question in st.session_state.pending_questions:
+            if question not in questions and not self._is_repeat_question(question):
+                questions.append(question)
+        st.session_state.pending_questions = []
+
+        if not questions:
+            return
+        if len(questions) == 1:
+            self._process_chat_message(
+                questions[0], members_df, operations_df, assignments_df
+            )
+            return
+
+        context = self._generate_context(members_df, operations_df, assignments_df)
+        answers = self._batch_answer(questions, context)
+        for question, answer in zip(questions, answers):
+            self._add_exchange(question, answer)
+
+    def _batch_answer(self, questions: List[str], context: str) -> List[str]:
+        """Answer several questions with one request, splitting on answer markers"""
+        numbered = "\n".join(f"{i}. {q}" for i, q in enumerate(questions, 1))
+        prompt = (
+            "Answer each of the following questions separately. Start each answer "
+            f"with a line containing only {_ANSWER_MARKER.format('<number>')}, "
+            f"for example {_ANSWER_MARKER.format(1)}, and use no other such "
+            f"lines.\n{numbered}"
+        )
+        try:
+            response = self._request_completion(
+                prompt, context, max_tokens=350 * len(questions)
+            )
+        except Exception as e:
+            # The request itself failed, so retrying each question would only
+            # repeat the failure; report it once per question instead
+            return [self._error_response(e)] * len(questions)
+
+        answers = _split_batch_answers(response, len(questions))
+        if answers is not None:
+            return answers
+
+        # Reply did not follow the markers, answer each question on its own
+        return [self.get_ai_response(q, context) for q in questions]
+
+    def _is_repeat_question(self, question: str) -> bool:
+        """Check whether the question was answered in the last exchange"""
+        history = st.session_state.chat_history
+        return (
+            len(history) >= 2
+            and history[-2]["role"] == "user"
+            and history[-2]["content"] == question
+        )
 
     def _process_chat_message(
         self,
@@ -304,8 +406,9 @@ class FloatingChatbot:
         assignments_df: pd.DataFrame,
     ):
         """Process and respond to chat message"""
-        # Add user message to history
-        st.session_state.chat_history.append({"role": "user", "content": user_input})
+        # Skip the API call when the same question was just answered
+        if self._is_repeat_question(user_input):
+            return
 
         # Generate context from data
         context = self._generate_context(members_df, operations_df, assignments_df)
@@ -313,11 +416,21 @@ class FloatingChatbot:
         # Get AI response
         bot_response = self.get_ai_response(user_input, context)
 
-        # Add bot response to history
+        self._add_exchange(user_input, bot_response)
+
+    def _add_exchange(self, user_input: str, bot_response: str):
+        """Add a question and its answer to the chat history"""
+        st.session_state.chat_history.append({"role": "user", "content": user_input})
         st.session_state.chat_history.append(
             {"role": "assistant", "content": bot_response}
         )
 
+        # Keep only the most recent messages to bound session memory
+        if len(st.session_state.chat_history) > MAX_CHAT_HISTORY:
+            st.session_state.chat_history = st.session_state.chat_history[
+                -MAX_CHAT_HISTORY:
+            ]
+
     def _generate_context(
         self,
         members_df: pd.DataFrame,
@@ -326,39 +439,36 @@ class FloatingChatbot:
     ) -> str:
         """Generate context from current data"""
         try:
-            total_members = len(members_df) if not members_df.empty else 0
-            active_members = (
-                len(members_df[members_df["status"] == "Active"])
-                if not members_df.empty
-                else 0
-            )
             total_operations = len(operations_df) if not operations_df.empty else 0
-            total_states = members_df["state"].nunique() if not members_df.empty else 0
 
-            top_state = (
-                members_df["state"].value_counts().index[0]
-                if not members_df.empty
-                else "N/A"
-            )
-            top_state_count = (
-                members_df["state"].value_counts().iloc[0]
-                if not members_df.empty
-                else 0
-            )
+            if not members_df.empty:
+                total_members = len(members_df)
+                # Compare the column directly instead of copying a filtered frame;
+                # on a categorical status this compares category codes
+                active_members = int((members_df["status"] == "Active").sum())
+                # A single value_counts pass serves both state statistics
+                state_counts = members_df["state"].value_counts()
+                total_states = len(state_counts)
+                top_state = state_counts.index[0]
+                top_state_count = state_counts.iloc[0]
+            else:
+                total_members = active_members = total_states = top_state_count = 0
+                top_state = "N/A"
+
+            stats = {
+                "total_members": total_members,
+                "active_members": active_members,
+                "inactive_members": total_members - active_members,
+                "total_operations": total_operations,
+                "total_states": total_states,
+                "top_state": top_state,
+                "top_state_count": top_state_count,
+                "page_context": st.session_state.get(
+                    "current_page_context", "Dashboard overview"
+                ),
+            }
 
-            context = f"""
-            Current RELA Malaysia Analytics Dashboard Data Summary:
-            - Total Members: {total_members:,}
-            - Active Members: {active_members:,}
-            - Inactive Members: {total_members - active_members:,}
-            - Total Operations: {total_operations:,}
-            - States Covered: {total_states}
-            - Top State by Members: {top_state} ({top_state_count:,} members)
-            
-            Current page context: {st.session_state.get('current_page_context', 'Dashboard overview')}
-            """
-
-            return context
+            return _CONTEXT_TEMPLATE.format_map(stats)
 
         except Exception as e:
             return f"Dashboard data available but unable to generate detailed context. Error: {str(e)}"
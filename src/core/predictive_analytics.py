@@ -195,7 +195,7 @@ class PredictiveAnalytics:
         operations_df['day_of_week'] = operations_df['start_date'].dt.dayofweek
         
         # Create time series features
-        monthly_ops = operations_df.groupby(['year_month', 'state', 'operation_type']).agg({
+        monthly_ops = operations_df.groupby(['year_month', 'state', 'operation_type'], observed=True).agg({
             'operation_id': 'count',
             'volunteers_required': 'sum',
             'complexity': lambda x: (x == 'High').sum(),
@@ -212,8 +212,8 @@ class PredictiveAnalytics:
         
         # Add lag features (previous month's data)
         monthly_ops = monthly_ops.sort_values(['state', 'operation_type', 'year', 'month'])
-        monthly_ops['prev_operation_count'] = monthly_ops.groupby(['state', 'operation_type'])['operation_count'].shift(1)
-        monthly_ops['prev_volunteers'] = monthly_ops.groupby(['state', 'operation_type'])['total_volunteers'].shift(1)
+        monthly_ops['prev_operation_count'] = monthly_ops.groupby(['state', 'operation_type'], observed=True)['operation_count'].shift(1)
+        monthly_ops['prev_volunteers'] = monthly_ops.groupby(['state', 'operation_type'], observed=True)['total_volunteers'].shift(1)
         
         # Remove rows with missing lag features
         training_data = monthly_ops.dropna()
@@ -1,15 +1,224 @@
 import pandas as pd
 import numpy as np
 import math
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+from itertools import islice, repeat
 from faker import Faker
-from datetime import datetime, timedelta
-import random
+from datetime import datetime
+
+try:
+    from .data_io import (
+        DATA_FILE_FORMAT,
+        _require_pyarrow,
+        pa,
+        pq,
+        write_frames,
+        write_metadata,
+    )
+except ImportError:
+    # Run directly as a script (python src/utils/data_generator.py)
+    from data_io import (
+        DATA_FILE_FORMAT,
+        _require_pyarrow,
+        pa,
+        pq,
+        write_frames,
+        write_metadata,
+    )
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Distinct Faker values pre-generated per field: about one per
+# FAKER_ROWS_PER_POOL_VALUE rows, at least FAKER_POOL_MIN_SIZE and at most
+# FAKER_POOL_SIZE. Rows sample the pool with replacement.
+FAKER_POOL_SIZE = 50000
+FAKER_POOL_MIN_SIZE = 2000
+FAKER_ROWS_PER_POOL_VALUE = 20
+
+# Faker providers sampled through pools when building members
+_FAKER_POOL_PROVIDERS = ("name", "phone_number", "street_address", "postcode")
+
+# Member counts below this are generated in-process; worker start-up would dominate
+PARALLEL_MIN_MEMBERS = 200000
+
+# Patronymic particles dropped from names, and characters stripped from email
+# local parts, when building member emails
+_NAME_PARTICLES = re.compile(r" (?:bin|binti|bt\.|b\.|s/o|a/l|d/o|a/p) ")
+_EMAIL_STRIP = re.compile(r"[^0-9a-z.]")
+
+# Rows per chunk when members are streamed in batches or written to a sink
+STREAM_BATCH_SIZE = 100000
+
+# Members are generated in fixed chunks of this many rows, each from its own
+# seed stream, so a seed gives the same members however they are batched or
+# spread over worker processes
+MEMBER_CHUNK_SIZE = 100000
+
+# Generator owned by each worker process of the member pool
+_worker_generator = None
+
+
+def _dates_from_ordinals(ordinals):
+    """Convert an array of day ordinals to datetime.date objects"""
+    epoch_ordinal = datetime(1970, 1, 1).toordinal()
+    return (ordinals - epoch_ordinal).astype("datetime64[D]").astype(object)
+
+
+def _generate_operations(num_operations, seed_sequence):
+    """Generate the operations dataset from its own seed stream"""
+    return DataGenerator(seed=seed_sequence).generate_operations_data(num_operations)
+
+
+def _init_member_worker(faker_pools):
+    """Create the per-process generator, sharing the parent's Faker pools
+
+    Every worker samples the same pools as the parent, so a chunk's rows do
+    not depend on which process generated it.
+    """
+    global _worker_generator
+    _worker_generator = DataGenerator()
+    _worker_generator._faker_pools = dict(faker_pools)
+
+
+def _faker_pool_size(total):
+    """Size of each Faker pool for a member dataset of `total` rows"""
+    return min(
+        FAKER_POOL_SIZE,
+        max(total, 1),
+        max(FAKER_POOL_MIN_SIZE, total // FAKER_ROWS_PER_POOL_VALUE),
+    )
+
+
+def _zero_padded(values, width):
+    """Format integers as zero-padded strings; unlike np.char.zfill, accepts no rows"""
+    return (
+        pd.Series(values, dtype=np.int64).astype(str).str.zfill(width).to_numpy(object)
+    )
+
+
+def _probabilities(weights):
+    """Normalize relative weights into a probability vector for Generator.choice"""
+    weights = np.asarray(weights, dtype=float)
+    return weights / weights.sum()
+
+
+def _generate_members_chunk(start, count, total, seed_sequence):
+    """Generate members [start, start + count) of a dataset of `total` rows"""
+    return _worker_generator._generate_seeded_block(start, count, total, seed_sequence)
+
+
+# Per-month quarterly training-cycle and seasonal (monsoon season, school
+# holidays) terms of the performance score, indexed by month 1-12
+_QUARTERLY_VARIATION = np.array(
+    [0.0] + [0.2 * math.sin(((m - 1) // 3 + 1) * math.pi / 2) for m in range(1, 13)]
+)
+_SEASONAL_BASE = np.array(
+    [0.0]
+    + [
+        0.05 * math.sin((m - 1) * math.pi / 6)
+        - (0.1 if m in (11, 12, 1, 2) else 0.0)
+        + (0.05 if m in (6, 7, 8) else 0.0)
+        for m in range(1, 13)
+    ]
+)
+
+
+def _score_kernel(
+    years, rank_bonus, months, days_from_start, noise, dip_mask, dip_amount, jitter
+):
+    """Performance scores of attended assignments from pre-sampled noise arrays"""
+    experience_bonus = np.minimum(years * 0.1, 1.5)
+    rank_bonus_score = rank_bonus * 10
+
+    # Temporal improvement: trend, quarterly training cycles, noise and setbacks
+    base_improvement = np.minimum(days_from_start * 0.0003, 0.8)
+    noise = noise - np.where(dip_mask, dip_amount, 0.0)
+    temporal_improvement = np.maximum(
+        base_improvement + _QUARTERLY_VARIATION[months] + noise, -0.5
+    )
+
+    score = (7.0 + experience_bonus + rank_bonus_score + temporal_improvement) * (
+        1.0 + _SEASONAL_BASE[months]
+    )
+    return np.minimum(np.maximum(score + jitter, 5.0), 10.0)
+
+
+if NUMBA_AVAILABLE:
+    _score_kernel = njit(parallel=True, fastmath=True, cache=True)(_score_kernel)
+
+
+# Per-rank tables indexed by rank code, in DataGenerator.ranks order (Volunteer,
+# Senior Volunteer, ..., State Commander). Higher ranks tend to have more
+# training and commendations; attendance bonuses stop at Platoon Commander.
+_RANK_TRAINING_MULTIPLIER = np.array([1.0, 1.2, 1.5, 1.8, 2.2, 2.5, 3.0, 3.5, 4.0])
+_RANK_COMMENDATION_BONUS = np.array(
+    [0.0, 0.02, 0.05, 0.08, 0.12, 0.15, 0.20, 0.25, 0.30]
+)
+_RANK_ATTENDANCE_BONUS = np.array([0.0, 0.02, 0.05, 0.07, 0.1, 0.0, 0.0, 0.0, 0.0])
+
+# Per-complexity tables (Low, Medium, High, Critical) and per-weather success
+# modifiers (Clear, Rainy, Cloudy, Stormy), indexed by category code
+_COMPLEXITY_SUCCESS_MODIFIER = np.array([0.08, 0.03, -0.05, -0.12])
+_COMPLEXITY_RESPONSE_RATE = np.array([0.85, 0.85, 0.9, 0.95])
+_COMPLEXITY_BASE_BUDGET = np.array([2000.0, 8000.0, 20000.0, 50000.0])
+_WEATHER_SUCCESS_MODIFIER = np.array([0.05, -0.08, 0.02, -0.15])
+
+
+def _operations_kernel(
+    complexity,
+    weather,
+    duration_hours,
+    hour,
+    volunteers_assigned,
+    success_noise,
+    response_noise,
+    budget_noise,
+):
+    """Success rate, responders and budget of operations from pre-sampled noise"""
+    # Success rate from complexity, weather and duration (long operations are harder)
+    success_rate = (
+        0.82
+        + _COMPLEXITY_SUCCESS_MODIFIER[complexity]
+        + _WEATHER_SUCCESS_MODIFIER[weather]
+        - 0.01 * np.maximum(0, duration_hours - 8)
+    )
+    success_rate = np.minimum(np.maximum(success_rate + success_noise, 0.3), 1.0)
+
+    # Response rate correlates with urgency; night operations respond less
+    night = (hour < 6) | (hour >= 22)
+    response_rate = _COMPLEXITY_RESPONSE_RATE[complexity] - np.where(night, 0.1, 0.0)
+    responded = (volunteers_assigned * (response_rate + response_noise)).astype(
+        np.int64
+    )
+    responded = np.minimum(np.maximum(responded, 1), volunteers_assigned)
+
+    # Budget allocation based on complexity and duration
+    budget = (
+        _COMPLEXITY_BASE_BUDGET[complexity] * (1 + duration_hours * 0.1) * budget_noise
+    )
+    return success_rate, responded, budget
+
+
+if NUMBA_AVAILABLE:
+    _operations_kernel = njit(parallel=True, fastmath=True, cache=True)(
+        _operations_kernel
+    )
 
 
 class DataGenerator:
-    def __init__(self):
+    def __init__(self, seed=None):
         # Use English locale since Malaysian locales are not supported
         self.fake = Faker("en_US")  # Use standard English locale for name generation
+        self._faker_pools = {}  # Faker values sampled by index, built on first use
+        self.seed(seed)
 
         # Malaysian states and federal territories
         self.states = [
@@ -75,6 +284,15 @@ class DataGenerator:
             "Putrajaya": ["Putrajaya"],
         }
 
+        # Districts of all states in one flat array, with each state's slice
+        # given by its offset and length (in self.states order)
+        district_counts = [len(self.districts[state]) for state in self.states]
+        self._district_flat = np.array(
+            [d for state in self.states for d in self.districts[state]], dtype=object
+        )
+        self._district_len = np.array(district_counts)
+        self._district_off = np.cumsum(district_counts) - self._district_len
+
         # RELA operation types
         self.operation_types = [
             "Security Control",
@@ -225,271 +443,367 @@ class DataGenerator:
             "Indira",
         ]
 
-    def generate_members_data(self, num_members=3000000):
-        """Generate comprehensive RELA member dataset"""
+        # Sampling probabilities of weighted columns, normalized once up front
+        self._state_probs = _probabilities(
+            [15, 8, 7, 4, 5, 6, 4, 9, 1, 12, 10, 18, 5, 8, 1, 1]
+        )  # Population-based weights
+        self._rank_probs = _probabilities(
+            [40, 25, 15, 8, 5, 3, 2, 1.5, 0.5]
+        )  # Hierarchical distribution
+        self._status_probs = _probabilities([70, 20, 5, 5])
+        # Malaysian demographic distribution: Malay, Chinese, Indian, Others
+        self._ethnicity_probs = _probabilities([60, 25, 10, 5])
+        self._education_probs = _probabilities([10, 35, 30, 20, 5])
+        self._duration_probs = _probabilities([20, 25, 20, 15, 10, 8, 2])
+        self._complexity_probs = _probabilities([40, 35, 20, 5])
+        self._weather_probs = _probabilities([50, 25, 20, 5])
+        self._operation_status_probs = _probabilities([70, 15, 10, 5])
+
+        # Malaysian email providers, rela.gov.my for official use
+        self.email_providers = [
+            "gmail.com",
+            "hotmail.com",
+            "yahoo.com",
+            "outlook.com",
+            "rela.gov.my",
+        ]
+        self._email_provider_probs = _probabilities([40, 20, 15, 10, 15])
+
+        # Low-cardinality member columns are stored as categoricals. The category
+        # sets are fixed so chunked frames concatenate without falling back to object
+        self._member_categories = {
+            "gender": pd.CategoricalDtype(["Male", "Female"]),
+            "age_group": pd.CategoricalDtype(self.age_groups, ordered=True),
+            "ethnicity": pd.CategoricalDtype(self.ethnicities),
+            "education_level": pd.CategoricalDtype(self.education_levels),
+            "state": pd.CategoricalDtype(self.states),
+            "rank": pd.CategoricalDtype(self.ranks),
+            "status": pd.CategoricalDtype(
+                ["Active", "Inactive", "On Leave", "Training"]
+            ),
+        }
+
+    def generate_members_data(self, num_members=3000000, n_jobs=None, sink=None):
+        """Generate comprehensive RELA member dataset
+
+        When `sink` is given (any object with a `write_batch` method, such as a
+        `pyarrow.parquet.ParquetWriter`), members are written to it as Arrow
+        record batches instead of being collected into one DataFrame, and
+        None is returned.
+        """
         print(f"Generating {num_members:,} RELA member records...")
 
-        members = []
-
-        for i in range(num_members):
-            if i % 100000 == 0:
-                print(f"Generated {i:,} members...")
-
-            # Basic demographics
-            gender = random.choice(["Male", "Female"])
-            age = self._generate_realistic_age()
-            age_group = self._get_age_group(age)
-
-            # Location
-            state = random.choices(
-                self.states,
-                weights=[
-                    15,
-                    8,
-                    7,
-                    4,
-                    5,
-                    6,
-                    4,
-                    9,
-                    1,
-                    12,
-                    10,
-                    18,
-                    5,
-                    8,
-                    1,
-                    1,
-                ],  # Population-based weights
-                k=1,
-            )[0]
-            district = random.choice(self.districts[state])
-
-            # RELA specific data
-            rank = random.choices(
-                self.ranks,
-                weights=[40, 25, 15, 8, 5, 3, 2, 1.5, 0.5],  # Hierarchical distribution
-                k=1,
-            )[0]
-
-            # Generate more realistic join dates with growth patterns
-            # Simulate organizational growth: more recent hires, expansion periods
-            current_year = datetime.now().year
-
-            # Create weighted periods for more realistic growth with better monthly distribution
-            if i < num_members * 0.15:  # 15% - founding members (8-10 years ago)
-                join_date = self.fake.date_between(start_date="-10y", end_date="-8y")
-            elif i < num_members * 0.35:  # 20% - early growth (6-8 years ago)
-                join_date = self.fake.date_between(start_date="-8y", end_date="-6y")
-            elif i < num_members * 0.55:  # 20% - steady period (4-6 years ago)
-                join_date = self.fake.date_between(start_date="-6y", end_date="-4y")
-            elif i < num_members * 0.75:  # 20% - expansion (2-4 years ago)
-                join_date = self.fake.date_between(start_date="-4y", end_date="-2y")
-            else:  # 25% - recent growth with better distribution across months
-                # Ensure more even distribution in recent 24 months
-                months_back = random.randint(0, 24)
-                start_date = datetime.now() - timedelta(days=months_back * 30 + 30)
-                end_date = datetime.now() - timedelta(days=months_back * 30)
-                join_date = self.fake.date_between(
-                    start_date=start_date.date(), end_date=end_date.date()
-                )
+        if sink is None:
+            chunks = list(self._iter_member_chunks(num_members, n_jobs))
+            df = chunks[0] if len(chunks) == 1 else pd.concat(chunks, ignore_index=True)
+            print(f"✅ Generated {len(df):,} RELA member records")
+            return df
+
+        _require_pyarrow()
+        written = 0
+        for chunk in self.generate_members_stream(num_members, n_jobs=n_jobs):
+            sink.write_batch(pa.RecordBatch.from_pandas(chunk, preserve_index=False))
+            written += len(chunk)
+        print(f"✅ Generated {written:,} RELA member records")
+        return None
+
+    def generate_members_stream(
+        self, num_members=3000000, batch_size=STREAM_BATCH_SIZE, n_jobs=None
+    ):
+        """Yield the member dataset as DataFrames of at most `batch_size` rows
+
+        Batches can be appended to a database as they arrive (see
+        `data_io.dump_to_duckdb`), so the full dataset never has to be held in
+        memory.
+        """
+        yield from self._iter_member_chunks(num_members, n_jobs, batch_size)
+
+    def dump_members_parquet(
+        self, path, num_members=3000000, batch_size=STREAM_BATCH_SIZE, n_jobs=None
+    ):
+        """Write the member dataset to a zstd-compressed Parquet file batch by batch
+
+        The writer is opened once with the schema of the first batch; each
+        batch becomes a row group, and categorical columns are stored
+        dictionary-encoded.
+        """
+        _require_pyarrow()
+        print(f"Writing {num_members:,} RELA member records to {path}...")
+
+        writer = None
+        rows = 0
+        try:
+            for chunk in self.generate_members_stream(num_members, batch_size, n_jobs):
+                batch = pa.RecordBatch.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(
+                        path, batch.schema, compression="zstd", use_dictionary=True
+                    )
+                writer.write_batch(batch)
+                rows += len(chunk)
+        finally:
+            if writer is not None:
+                writer.close()
+
+        print(f"✅ Wrote {rows:,} RELA member records to {path}")
+        return rows
+
+    def _iter_member_chunks(self, num_members, n_jobs=None, batch_size=None):
+        """Yield the member dataset as consecutive DataFrame chunks
+
+        Chunks follow a fixed grid of MEMBER_CHUNK_SIZE rows, each generated
+        from its own child of the seed sequence. `n_jobs` only decides where
+        chunks are generated and `batch_size` only how they are sliced, so
+        neither changes the generated members.
+        """
+        n_jobs = n_jobs or os.cpu_count() or 1
+        starts = range(0, max(num_members, 1), MEMBER_CHUNK_SIZE)
+        counts = [min(MEMBER_CHUNK_SIZE, num_members - start) for start in starts]
+        seeds = self._seed_sequence.spawn(len(starts))
+        chunks = zip(starts, counts, repeat(num_members), seeds)
+
+        parallel = (
+            n_jobs > 1 and len(starts) > 1 and num_members >= PARALLEL_MIN_MEMBERS
+        )
+        if parallel:
+            frames = self._generate_chunks_parallel(chunks, num_members, n_jobs)
+        else:
+            frames = (self._generate_seeded_block(*chunk) for chunk in chunks)
+
+        for df in frames:
+            if not batch_size or len(df) <= batch_size:
+                yield df
+                continue
+            for offset in range(0, len(df), batch_size):
+                yield df.iloc[offset : offset + batch_size].reset_index(drop=True)
+
+    def _generate_chunks_parallel(self, chunks, num_members, n_jobs):
+        """Generate member chunks in worker processes, yielding them in order"""
+        # Workers sample the same Faker pools as in-process generation
+        self._build_faker_pools(_faker_pool_size(num_members))
+        with ProcessPoolExecutor(
+            n_jobs, initializer=_init_member_worker, initargs=(self._faker_pools,)
+        ) as executor:
+            # Keep at most n_jobs chunks in flight so finished chunks do not
+            # pile up in memory while the consumer is still busy
+            pending = deque(
+                executor.submit(_generate_members_chunk, *chunk)
+                for chunk in islice(chunks, n_jobs)
+            )
+            while pending:
+                df = pending.popleft().result()
+                for chunk in islice(chunks, 1):
+                    pending.append(executor.submit(_generate_members_chunk, *chunk))
+                yield df
+
+    def _generate_seeded_block(self, start, count, total, seed_sequence):
+        """Generate a block of members from its own seed stream"""
+        rng = self._rng
+        self._rng = np.random.default_rng(seed_sequence)
+        try:
+            return self._generate_members_block(start, count, total)
+        finally:
+            self._rng = rng
+
+    def _generate_members_block(self, start, count, total):
+        """Generate members [start, start + count) of a dataset of `total` rows"""
+        n = count
+        now = datetime.now()
+        today = now.date()
+
+        # Pool sizes depend on the whole dataset, not on how it is chunked
+        self._build_faker_pools(_faker_pool_size(total))
+
+        # Basic demographics, sampled a whole column at a time
+        gender = self._choose(["Male", "Female"], n)
+        age = np.clip(self._rng.normal(42, 14, n).astype(np.int16), 18, 75)
+        age_group = np.array(self.age_groups, dtype=object)[
+            np.digitize(age, [26, 36, 46, 56, 66])
+        ]
 
-            years_service = (datetime.now().date() - join_date).days / 365.25
-
-            status = random.choices(
-                ["Active", "Inactive", "On Leave", "Training"],
-                weights=[70, 20, 5, 5],
-                k=1,
-            )[0]
-
-            # Generate ethnicity-appropriate name
-            ethnicity = random.choices(
-                self.ethnicities,
-                weights=[
-                    60,
-                    25,
-                    10,
-                    5,
-                ],  # Malaysian demographic distribution: Malay, Chinese, Indian, Others
-                k=1,
-            )[0]
-
-            full_name = self._generate_malaysian_name(gender, ethnicity)
-
-            # Generate member record
-            member = {
-                "member_id": f"RELA{str(i+1).zfill(8)}",
+        # Location
+        state_idx = self._rng.choice(len(self.states), size=n, p=self._state_probs)
+        state = np.array(self.states, dtype=object)[state_idx]
+        district = self._sample_districts(state_idx)
+
+        # RELA specific data
+        rank_idx = self._rng.choice(len(self.ranks), size=n, p=self._rank_probs)
+        rank = np.array(self.ranks, dtype=object)[rank_idx]
+        status = self._choose(
+            ["Active", "Inactive", "On Leave", "Training"], n, self._status_probs
+        )
+        ethnicity = self._choose(self.ethnicities, n, self._ethnicity_probs)
+        education_level = self._choose(self.education_levels, n, self._education_probs)
+
+        # Generate ethnicity-appropriate names
+        full_name = self._generate_names_bulk(gender, ethnicity)
+        ic_number = self._generate_ic_numbers_bulk(n, now.year)
+        phone_number = self._generate_malaysian_phones_bulk(n)
+        email = self._generate_emails_bulk(full_name)
+
+        member_id = "RELA" + _zero_padded(np.arange(start, start + n) + 1, 8)
+
+        # Generate more realistic join dates with growth patterns, simulating
+        # organizational growth by global row position: founding members (15%,
+        # 8-10 years ago), early growth (20%, 6-8), steady period (20%, 4-6),
+        # expansion (20%, 2-4) and recent growth (25%) spread evenly over the
+        # last 24 months. Dates are drawn as day ordinals.
+        today_ordinal = today.toordinal()
+        position = np.arange(start, start + n)
+        bucket = np.searchsorted(
+            np.array([0.15, 0.35, 0.55, 0.75]) * total, position, side="right"
+        )
+        bucket_starts = today_ordinal - (np.array([10, 8, 6, 4]) * 365.25).astype(int)
+        bucket_ends = today_ordinal - (np.array([8, 6, 4, 2]) * 365.25).astype(int)
+        months_back = self._rng.integers(0, 25, n)
+        recent = bucket == 4
+        earlier = np.minimum(bucket, 3)
+        join_ordinal = self._rng.integers(
+            np.where(
+                recent, today_ordinal - months_back * 30 - 30, bucket_starts[earlier]
+            ),
+            np.where(recent, today_ordinal - months_back * 30, bucket_ends[earlier])
+            + 1,
+        )
+        join_date = _dates_from_ordinals(join_ordinal)
+        years_service = (today_ordinal - join_ordinal) / 365.25
+
+        training_completed = self._generate_training_bulk(years_service, rank_idx)
+        operations_participated = self._generate_operations_count_bulk(
+            years_service, status
+        )
+        commendations = self._generate_commendations_bulk(years_service, rank_idx)
+
+        last_active_date = self._generate_last_active_dates_bulk(status, today_ordinal)
+
+        # Faker fields drawn from pre-generated pools instead of per-row calls
+        emergency_contact = self._sample_faker_pool("phone_number", n)
+        address = self._sample_faker_pool("street_address", n) + ", " + district
+        address = address + ", " + state
+        postal_code = self._sample_faker_pool("postcode", n)
+
+        df = pd.DataFrame(
+            {
+                "member_id": member_id,
                 "full_name": full_name,
-                "ic_number": self._generate_ic_number(),
+                "ic_number": ic_number,
                 "gender": gender,
-                "age": age,
+                "age": age.astype(np.int8),
                 "age_group": age_group,
                 "ethnicity": ethnicity,
-                "education_level": random.choices(
-                    self.education_levels, weights=[10, 35, 30, 20, 5], k=1
-                )[0],
+                "education_level": education_level,
                 "state": state,
                 "district": district,
                 "rank": rank,
                 "status": status,
                 "join_date": join_date,
-                "years_of_service": round(years_service, 1),
-                "phone_number": self._generate_malaysian_phone(),
-                "email": self._generate_realistic_email(full_name),
-                "training_completed": self._generate_realistic_training(
-                    years_service, rank
-                ),
-                "operations_participated": self._generate_realistic_operations_count(
-                    years_service, status
-                ),
-                "commendations": self._generate_realistic_commendations(
-                    years_service, rank
-                ),
-                "last_active_date": self._generate_last_active_date(status),
-                "emergency_contact": self.fake.phone_number(),
-                "address": f"{self.fake.street_address()}, {district}, {state}",
-                "postal_code": self.fake.postcode(),
-                "created_at": datetime.now(),
-                "updated_at": datetime.now(),
+                "years_of_service": np.round(years_service, 1).astype(np.float32),
+                "phone_number": phone_number,
+                "email": email,
+                "training_completed": training_completed.astype(np.int16),
+                "operations_participated": operations_participated.astype(np.int32),
+                "commendations": commendations.astype(np.int16),
+                "last_active_date": last_active_date,
+                "emergency_contact": emergency_contact,
+                "address": address,
+                "postal_code": postal_code,
+                "created_at": now,
+                "updated_at": now,
             }
-
-            members.append(member)
-
-        df = pd.DataFrame(members)
-        print(f"✅ Generated {len(df):,} RELA member records")
-        return df
+        )
+        return df.astype(self._member_categories)
 
     def generate_operations_data(self, num_operations=50000):
         """Generate RELA operations dataset"""
         print(f"Generating {num_operations:,} operation records...")
 
-        operations = []
-
-        for i in range(num_operations):
-            if i % 10000 == 0:
-                print(f"Generated {i:,} operations...")
-
-            state = random.choice(self.states)
-            district = random.choice(self.districts[state])
-            operation_type = random.choice(self.operation_types)
-
-            start_date = self.fake.date_time_between(start_date="-2y", end_date="now")
-            duration_hours = random.choices(
-                [2, 4, 6, 8, 12, 24, 48], weights=[20, 25, 20, 15, 10, 8, 2], k=1
-            )[0]
-            end_date = start_date + timedelta(hours=duration_hours)
+        n = num_operations
+        now = datetime.now()
 
-            # Operation complexity affects resource allocation
-            complexity = random.choices(
-                ["Low", "Medium", "High", "Critical"], weights=[40, 35, 20, 5], k=1
-            )[0]
+        state_idx = self._rng.integers(0, len(self.states), n)
+        state = np.array(self.states, dtype=object)[state_idx]
+        district = self._sample_districts(state_idx)
+        operation_type = self._choose(self.operation_types, n)
 
-            volunteers_assigned = self._get_volunteers_by_complexity(complexity)
-
-            # More realistic success rate based on multiple factors
-            base_success_rate = 0.82
-
-            # Complexity affects success rate
-            complexity_modifier = {
-                "Low": 0.08,
-                "Medium": 0.03,
-                "High": -0.05,
-                "Critical": -0.12,
-            }
-
-            # Weather affects success rate
-            weather = random.choices(
-                ["Clear", "Rainy", "Cloudy", "Stormy"], weights=[50, 25, 20, 5], k=1
-            )[0]
-            weather_modifier = {
-                "Clear": 0.05,
-                "Cloudy": 0.02,
-                "Rainy": -0.08,
-                "Stormy": -0.15,
-            }
-
-            # Duration affects success rate (very long operations are harder)
-            duration_modifier = -0.01 * max(0, duration_hours - 8)
-
-            final_success_rate = (
-                base_success_rate
-                + complexity_modifier.get(complexity, 0)
-                + weather_modifier.get(weather, 0)
-                + duration_modifier
-            )
-            final_success_rate = max(
-                0.3, min(1.0, final_success_rate + random.uniform(-0.1, 0.1))
-            )
-
-            # Response rate correlates with operation urgency and timing
-            base_response_rate = 0.85
-            if complexity == "Critical":
-                base_response_rate = 0.95
-            elif complexity == "High":
-                base_response_rate = 0.9
-
-            # Night operations have lower response rates
-            time_of_day = self._get_time_category(start_date.hour)
-            if time_of_day == "Night":
-                base_response_rate -= 0.1
-
-            volunteers_responded = int(
-                volunteers_assigned * (base_response_rate + random.uniform(-0.05, 0.05))
-            )
-            volunteers_responded = max(
-                1, min(volunteers_assigned, volunteers_responded)
-            )
+        # Start times spread uniformly over the last two years
+        start_dates = pd.Timestamp(now).floor("s") - pd.to_timedelta(
+            self._rng.integers(0, 2 * 365 * 24 * 3600, n), unit="s"
+        )
+        duration_hours = self._choose(
+            [2, 4, 6, 8, 12, 24, 48], n, self._duration_probs
+        ).astype(np.int64)
+        end_dates = start_dates + pd.to_timedelta(duration_hours, unit="h")
+
+        # Operation complexity affects resource allocation; complexity and
+        # weather are kept as integer codes for the lookup tables
+        complexity_names = np.array(["Low", "Medium", "High", "Critical"], dtype=object)
+        complexity_idx = self._rng.choice(4, n, p=self._complexity_probs)
+        complexity = complexity_names[complexity_idx]
+
+        volunteers_low = np.array([5, 20, 50, 100])
+        volunteers_high = np.array([20, 50, 100, 200])
+        volunteers_assigned = self._rng.integers(
+            volunteers_low[complexity_idx], volunteers_high[complexity_idx] + 1
+        )
 
-            # Budget allocation based on complexity and duration
-            base_budget = {
-                "Low": 2000,
-                "Medium": 8000,
-                "High": 20000,
-                "Critical": 50000,
-            }
-            budget_allocated = (
-                base_budget[complexity]
-                * (1 + duration_hours * 0.1)
-                * random.uniform(0.8, 1.2)
-            )
+        # Weather affects success rate (Clear, Rainy, Cloudy, Stormy)
+        weather_names = np.array(["Clear", "Rainy", "Cloudy", "Stormy"], dtype=object)
+        weather_idx = self._rng.choice(4, n, p=self._weather_probs)
+        weather = weather_names[weather_idx]
+
+        hour = start_dates.hour.to_numpy()
+        time_of_day = np.array(
+            ["Night", "Morning", "Afternoon", "Evening", "Night"], dtype=object
+        )[np.digitize(hour, [6, 12, 18, 22])]
+
+        # More realistic success, response and budget figures from one fused pass
+        final_success_rate, volunteers_responded, budget_allocated = _operations_kernel(
+            complexity_idx,
+            weather_idx,
+            duration_hours,
+            hour,
+            volunteers_assigned,
+            self._rng.uniform(-0.1, 0.1, n),
+            self._rng.uniform(-0.05, 0.05, n),
+            self._rng.uniform(0.8, 1.2, n),
+        )
 
-            operation = {
-                "operation_id": f"OPS{str(i+1).zfill(6)}",
-                "operation_name": f"{operation_type} - {district}",
+        df = pd.DataFrame(
+            {
+                "operation_id": "OPS" + _zero_padded(np.arange(1, n + 1), 6),
+                "operation_name": operation_type + " - " + district,
                 "operation_type": operation_type,
                 "state": state,
                 "district": district,
-                "start_date": start_date,
-                "end_date": end_date,
-                "duration_hours": duration_hours,
-                "status": random.choices(
+                "start_date": start_dates,
+                "end_date": end_dates,
+                "duration_hours": duration_hours.astype(np.int16),
+                "status": self._choose(
                     ["Completed", "Ongoing", "Planned", "Cancelled"],
-                    weights=[70, 15, 10, 5],
-                    k=1,
-                )[0],
+                    n,
+                    self._operation_status_probs,
+                ),
                 "complexity": complexity,
                 "volunteers_assigned": volunteers_assigned,
                 "volunteers_responded": volunteers_responded,
-                "success_rate": round(final_success_rate, 3),
-                "budget_allocated": round(budget_allocated, 2),
-                "equipment_used": random.randint(
-                    max(1, volunteers_assigned // 5), volunteers_assigned // 2
+                "success_rate": np.round(final_success_rate, 3),
+                "budget_allocated": np.round(budget_allocated, 2),
+                "equipment_used": self._rng.integers(
+                    np.maximum(1, volunteers_assigned // 5),
+                    volunteers_assigned // 2 + 1,
                 ),
-                "vehicles_deployed": random.randint(
-                    1, max(2, volunteers_assigned // 10)
+                "vehicles_deployed": self._rng.integers(
+                    1, np.maximum(2, volunteers_assigned // 10) + 1
                 ),
-                "public_impact_score": round(random.uniform(1, 10), 1),
-                "media_coverage": random.random()
-                < (0.8 if complexity in ["High", "Critical"] else 0.2),
+                "public_impact_score": np.round(self._rng.uniform(1, 10, n), 1),
+                "media_coverage": self._rng.random(n)
+                < np.where(complexity_idx >= 2, 0.8, 0.2),
                 "weather_condition": weather,
                 "time_of_day": time_of_day,
-                "created_at": datetime.now(),
-                "updated_at": datetime.now(),
+                "created_at": now,
+                "updated_at": now,
             }
-
-            operations.append(operation)
-
-        df = pd.DataFrame(operations)
+        )
         print(f"✅ Generated {len(df):,} operation records")
         return df
 
@@ -497,159 +811,139 @@ class DataGenerator:
         """Generate individual volunteer assignments"""
         print(f"Generating {num_assignments:,} assignment records...")
 
-        assignments = []
+        now = datetime.now()
 
         # Sample active members for assignments
         active_members = members_df[members_df["status"] == "Active"].sample(
-            min(len(members_df), num_assignments // 3)
+            min(len(members_df), num_assignments // 3), random_state=self._rng
         )
 
-        for i in range(num_assignments):
-            if i % 20000 == 0:
-                print(f"Generated {i:,} assignments...")
+        # Draw every assignment's member up front and read member fields as arrays
+        member_idx = self._rng.integers(0, len(active_members), num_assignments)
+        member_ids = active_members["member_id"].to_numpy()[member_idx]
+        member_states = active_members["state"].to_numpy()[member_idx]
+        member_districts = active_members["district"].to_numpy()[member_idx]
+        member_years = active_members["years_of_service"].to_numpy(np.float64)[
+            member_idx
+        ]
 
-            # Select random member
-            member = active_members.sample(1).iloc[0]
+        # More realistic performance metrics
+        # Attendance rate correlates with member experience and rank
+        base_attendance_rate = 0.85
 
-            assignment_type = random.choice(self.operation_types)
-            assignment_date = self.fake.date_time_between(
-                start_date="-1y", end_date="now"
-            )
+        # Adjust based on member characteristics; unknown ranks get no bonus
+        rank_codes = pd.Categorical(active_members["rank"], categories=self.ranks).codes
+        member_rank_adj = np.where(
+            rank_codes >= 0, _RANK_ATTENDANCE_BONUS[rank_codes], 0.0
+        )[member_idx]
 
-            # More realistic performance metrics
-            # Attendance rate correlates with member experience and rank
-            base_attendance_rate = 0.85
-
-            # Adjust based on member characteristics
-            rank_bonus = {
-                "Volunteer": 0,
-                "Senior Volunteer": 0.02,
-                "Team Leader": 0.05,
-                "Squad Leader": 0.07,
-                "Platoon Commander": 0.1,
-            }
-            rank_adj = rank_bonus.get(member.get("rank", "Volunteer"), 0)
+        years_bonus = np.minimum(member_years * 0.01, 0.1)
+        final_attendance_rate = np.minimum(
+            base_attendance_rate + member_rank_adj + years_bonus, 0.95
+        )
 
-            years_bonus = min(member.get("years_of_service", 0) * 0.01, 0.1)
-            final_attendance_rate = min(
-                base_attendance_rate + rank_adj + years_bonus, 0.95
-            )
+        n = num_assignments
+        assignment_type = self._choose(self.operation_types, n)
 
-            attendance = random.random() < final_attendance_rate
+        # Assignment times spread uniformly over the last year
+        assignment_date = pd.Timestamp(now).floor("s") - pd.to_timedelta(
+            self._rng.integers(0, 365 * 24 * 3600, n), unit="s"
+        )
+        score_months = assignment_date.month.to_numpy(np.int64)
+        score_days = (assignment_date - pd.Timestamp(2023, 1, 1)).days.to_numpy(
+            np.float64
+        )
 
-            # Performance score based on attendance, experience, and temporal improvement
-            if attendance:
-                base_score = 7.0
-                experience_bonus = min(member.get("years_of_service", 0) * 0.1, 1.5)
-                rank_bonus_score = (
-                    rank_bonus.get(member.get("rank", "Volunteer"), 0) * 10
-                )
+        attendance = self._rng.random(n) < final_attendance_rate
+        feedback_score = np.where(attendance, self._rng.uniform(1, 5, n), np.nan)
+
+        # Performance score based on attendance, experience, and temporal improvement
+        scores = _score_kernel(
+            member_years,
+            member_rank_adj,
+            score_months,
+            score_days,
+            self._rng.uniform(-0.3, 0.3, n),
+            self._rng.random(n) < 0.1,  # Occasional performance dips
+            self._rng.uniform(0.2, 0.5, n),
+            self._rng.uniform(-1.2, 1.2, n),
+        )
 
-                # Add realistic temporal improvement with fluctuations
-                days_from_start = (assignment_date - datetime(2023, 1, 1)).days
-                # Base improvement trend
-                base_improvement = min(days_from_start * 0.0003, 0.8)
-                # Add quarterly fluctuations (training cycles, seasonal effects)
-                quarter = ((assignment_date.month - 1) // 3) + 1
-                quarterly_variation = 0.2 * math.sin(quarter * math.pi / 2)
-                # Add some realistic noise and occasional setbacks
-                noise = random.uniform(-0.3, 0.3)
-                # Occasional performance dips (10% chance)
-                if random.random() < 0.1:
-                    noise -= random.uniform(0.2, 0.5)
-                temporal_improvement = base_improvement + quarterly_variation + noise
-                temporal_improvement = max(
-                    temporal_improvement, -0.5
-                )  # Don't go too negative
-
-                # More realistic seasonal variations
-                seasonal_base = 0.05 * math.sin(
-                    (assignment_date.month - 1) * math.pi / 6
-                )
-                # Add weather-related effects
-                if assignment_date.month in [11, 12, 1, 2]:  # Monsoon season
-                    seasonal_base -= 0.1
-                elif assignment_date.month in [
-                    6,
-                    7,
-                    8,
-                ]:  # School holidays - better availability
-                    seasonal_base += 0.05
-                month_factor = 1.0 + seasonal_base
-
-                performance_score = (
-                    base_score
-                    + experience_bonus
-                    + rank_bonus_score
-                    + temporal_improvement
-                )
-                performance_score *= month_factor
-                performance_score += random.uniform(
-                    -1.2, 1.2
-                )  # More realistic random variation
-                performance_score = min(
-                    max(performance_score, 5.0), 10.0
-                )  # Bounds checking
-            else:
-                performance_score = 0
-
-            assignment = {
-                "assignment_id": f"ASG{str(i+1).zfill(7)}",
-                "member_id": member["member_id"],
+        df = pd.DataFrame(
+            {
+                "assignment_id": "ASG" + _zero_padded(np.arange(1, n + 1), 7),
+                "member_id": member_ids,
                 "assignment_type": assignment_type,
                 "assignment_date": assignment_date,
-                "state": member["state"],
-                "district": member["district"],
-                "duration_hours": random.choice([2, 4, 6, 8, 10, 12]),
+                "state": member_states,
+                "district": member_districts,
+                "duration_hours": self._rng.choice([2, 4, 6, 8, 10, 12], n),
                 "attendance": attendance,
-                "performance_score": round(performance_score, 1),
-                "role": random.choice(["Leader", "Member", "Coordinator", "Support"]),
-                "equipment_issued": random.choice([True, False]),
-                "transportation_provided": random.choice([True, False]),
-                "overtime": random.choice([True, False]),
-                "hazard_level": random.choice(["Low", "Medium", "High"]),
-                "training_required": random.choice([True, False]),
-                "feedback_score": random.uniform(1, 5) if attendance else None,
-                "created_at": datetime.now(),
-                "updated_at": datetime.now(),
+                "performance_score": np.where(attendance, np.round(scores, 1), 0.0),
+                "role": self._choose(["Leader", "Member", "Coordinator", "Support"], n),
+                "equipment_issued": self._rng.random(n) < 0.5,
+                "transportation_provided": self._rng.random(n) < 0.5,
+                "overtime": self._rng.random(n) < 0.5,
+                "hazard_level": self._choose(["Low", "Medium", "High"], n),
+                "training_required": self._rng.random(n) < 0.5,
+                "feedback_score": feedback_score,
+                "created_at": now,
+                "updated_at": now,
             }
-
-            assignments.append(assignment)
-
-        df = pd.DataFrame(assignments)
+        )
         print(f"✅ Generated {len(df):,} assignment records")
         return df
 
-    def _generate_realistic_age(self):
-        """Generate realistic age distribution for volunteers"""
-        # More realistic age distribution for Malaysian volunteers
-        age = int(np.random.normal(42, 14))  # Mean 42, std 14
-        return max(18, min(75, age))  # Ensure within valid range
-
-    def _get_age_group(self, age):
-        """Categorize age into groups"""
-        if age < 26:
-            return "18-25"
-        elif age < 36:
-            return "26-35"
-        elif age < 46:
-            return "36-45"
-        elif age < 56:
-            return "46-55"
-        elif age < 66:
-            return "56-65"
+    def seed(self, seed=None):
+        """Seed the NumPy and Faker random sources from one seed
+
+        `seed` may be an int, a `np.random.SeedSequence` or None for fresh
+        entropy. Each source gets its own child stream of the seed sequence.
+        """
+        if isinstance(seed, np.random.SeedSequence):
+            self._seed_sequence = seed
         else:
-            return "65+"
+            self._seed_sequence = np.random.SeedSequence(seed)
+        numpy_seed, faker_seed = self._seed_sequence.spawn(2)
+        self._rng = np.random.default_rng(numpy_seed)
+        self.fake.seed_instance(int(faker_seed.generate_state(1)[0]))
+        self._faker_pools = {}
+
+    def _build_faker_pools(self, pool_size):
+        """Pre-generate every pooled Faker provider, unless its pool is large enough"""
+        for provider in _FAKER_POOL_PROVIDERS:
+            pool = self._faker_pools.get(provider)
+            if pool is None or len(pool) < pool_size:
+                generate = getattr(self.fake, provider)
+                self._faker_pools[provider] = np.array(
+                    [generate() for _ in range(pool_size)], dtype=object
+                )
+
+    def _sample_faker_pool(self, provider, size):
+        """Sample values of a Faker provider, with replacement, from its pool"""
+        pool = self._faker_pools[provider]
+        return pool[self._rng.integers(0, len(pool), size)]
+
+    def _sample_districts(self, state_idx):
+        """Sample a uniformly random district within each row's state"""
+        offset = self._rng.integers(0, self._district_len[state_idx])
+        return self._district_flat[self._district_off[state_idx] + offset]
+
+    def _choose(self, values, size, p=None):
+        """Sample a column of values, uniformly or with the given probabilities"""
+        if p is None:
+            idx = self._rng.integers(0, len(values), size)
+        else:
+            idx = self._rng.choice(len(values), size=size, p=p)
+        return np.array(values, dtype=object)[idx]
 
-    def _generate_ic_number(self):
-        """Generate realistic Malaysian IC number format"""
+    def _generate_ic_numbers_bulk(self, size, current_year):
+        """Generate realistic Malaysian IC numbers for a whole column"""
         # Generate birth year based on realistic age ranges
-        current_year = datetime.now().year
-        birth_year = current_year - random.randint(18, 75)
-        year_code = birth_year % 100
+        year_code = (current_year - self._rng.integers(18, 76, size)) % 100
 
-        month = random.randint(1, 12)
-        day = random.randint(1, 28)
+        month = self._rng.integers(1, 13, size)
+        day = self._rng.integers(1, 29, size)
 
         # Malaysian state birth place codes (realistic)
         state_codes = {
@@ -671,279 +965,298 @@ class DataGenerator:
             "Putrajaya": [16],
         }
 
-        # Random state and corresponding place code
-        state = random.choice(list(state_codes.keys()))
-        place_code = random.choice(state_codes[state])
+        # Random state, then a random place code within it
+        place_codes = np.array(
+            [code for codes in state_codes.values() for code in codes]
+        )
+        place_weights = np.array(
+            [1 / len(codes) for codes in state_codes.values() for _ in codes]
+        )
+        place_code = self._rng.choice(
+            place_codes, size, p=_probabilities(place_weights)
+        )
 
         # Last 4 digits (first 3 are sequence, last is check digit)
-        sequence = random.randint(100, 999)
-        check_digit = random.randint(0, 9)
-
-        return f"{year_code:02d}{month:02d}{day:02d}{place_code:02d}{sequence}{check_digit}"
+        sequence = self._rng.integers(100, 1000, size)
+        check_digit = self._rng.integers(0, 10, size)
+
+        # Every part has a fixed width, so pack them into one 12-digit number
+        ic_value = (
+            year_code * 10**10
+            + month * 10**8
+            + day * 10**6
+            + place_code * 10**4
+            + sequence * 10
+            + check_digit
+        )
+        return _zero_padded(ic_value, 12)
 
-    def _generate_malaysian_phone(self):
-        """Generate realistic Malaysian phone number format"""
+    def _generate_malaysian_phones_bulk(self, size):
+        """Generate realistic Malaysian phone numbers for a whole column"""
         # 80% mobile, 20% landline (realistic distribution)
-        if random.random() < 0.8:
-            # Mobile numbers (more realistic prefixes)
-            mobile_prefixes = [
-                "010",
-                "011",
-                "012",
-                "013",
-                "014",
-                "015",
-                "016",
-                "017",
-                "018",
-                "019",
-            ]
-            prefix = random.choice(mobile_prefixes)
-            number = f"{prefix}-{random.randint(1000000, 9999999)}"
-        else:
-            # Landline numbers by state
-            landline_prefixes = {
-                "Kuala Lumpur": "03",
-                "Selangor": "03",
-                "Johor": "07",
-                "Penang": "04",
-                "Perak": "05",
-                "Kedah": "04",
-                "Kelantan": "09",
-                "Terengganu": "09",
-                "Pahang": "09",
-                "Negeri Sembilan": "06",
-                "Malacca": "06",
-                "Sabah": "088",
-                "Sarawak": "082",
-                "Perlis": "04",
-                "Labuan": "087",
-                "Putrajaya": "03",
-            }
-            state = random.choice(list(landline_prefixes.keys()))
-            prefix = landline_prefixes[state]
-            if len(prefix) == 2:
-                number = f"{prefix}-{random.randint(1000000, 9999999)}"
-            else:  # 3-digit prefix for East Malaysia
-                number = f"{prefix}-{random.randint(100000, 999999)}"
-
-        return number
-
-    def _generate_last_active_date(self, status):
-        """Generate last active date based on status"""
-        if status == "Active":
-            return self.fake.date_between(start_date="-30d", end_date="today")
-        elif status == "On Leave":
-            return self.fake.date_between(start_date="-90d", end_date="-30d")
-        elif status == "Training":
-            return self.fake.date_between(start_date="-7d", end_date="today")
-        else:  # Inactive
-            return self.fake.date_between(start_date="-365d", end_date="-90d")
-
-    def _get_volunteers_by_complexity(self, complexity):
-        """Determine volunteer allocation based on operation complexity"""
-        if complexity == "Low":
-            return random.randint(5, 20)
-        elif complexity == "Medium":
-            return random.randint(20, 50)
-        elif complexity == "High":
-            return random.randint(50, 100)
-        else:  # Critical
-            return random.randint(100, 200)
-
-    def _get_time_category(self, hour):
-        """Categorize time of day"""
-        if 6 <= hour < 12:
-            return "Morning"
-        elif 12 <= hour < 18:
-            return "Afternoon"
-        elif 18 <= hour < 22:
-            return "Evening"
-        else:
-            return "Night"
-
-    def _generate_malaysian_name(self, gender, ethnicity):
-        """Generate Malaysian names based on ethnicity and gender"""
-        if ethnicity == "Malay":
-            if gender == "Male":
-                first_name = random.choice(self.malay_male_names)
-                last_name = (
-                    random.choice(["bin", "b."])
-                    + " "
-                    + random.choice(self.malay_male_names)
-                )
-            else:
-                first_name = random.choice(self.malay_female_names)
-                last_name = (
-                    random.choice(["binti", "bt."])
-                    + " "
-                    + random.choice(self.malay_male_names)
-                )
-            return f"{first_name} {last_name}"
-
-        elif ethnicity == "Chinese":
-            if gender == "Male":
-                name = random.choice(self.chinese_male_names)
-            else:
-                name = random.choice(self.chinese_female_names)
-            family_name = random.choice(
-                ["Lim", "Tan", "Lee", "Ong", "Ng", "Wong", "Teh", "Chan"]
+        is_mobile = self._rng.random(size) < 0.8
+
+        # Mobile numbers (more realistic prefixes)
+        mobile_prefixes = [
+            "010",
+            "011",
+            "012",
+            "013",
+            "014",
+            "015",
+            "016",
+            "017",
+            "018",
+            "019",
+        ]
+        # Landline numbers by state
+        landline_prefixes = {
+            "Kuala Lumpur": "03",
+            "Selangor": "03",
+            "Johor": "07",
+            "Penang": "04",
+            "Perak": "05",
+            "Kedah": "04",
+            "Kelantan": "09",
+            "Terengganu": "09",
+            "Pahang": "09",
+            "Negeri Sembilan": "06",
+            "Malacca": "06",
+            "Sabah": "088",
+            "Sarawak": "082",
+            "Perlis": "04",
+            "Labuan": "087",
+            "Putrajaya": "03",
+        }
+        prefix = np.where(
+            is_mobile,
+            self._choose(mobile_prefixes, size),
+            self._choose(list(landline_prefixes.values()), size),
+        )
+
+        # 3-digit landline prefixes (East Malaysia) take 6-digit numbers
+        short_number = ~is_mobile & (np.char.str_len(prefix.astype(str)) == 3)
+        number = np.where(
+            short_number,
+            self._rng.integers(100000, 1000000, size),
+            self._rng.integers(1000000, 10000000, size),
+        )
+
+        return prefix + "-" + number.astype(str).astype(object)
+
+    def _generate_last_active_dates_bulk(self, status, today_ordinal):
+        """Generate last active dates based on status for a whole column"""
+        # Window of days back from today, (newest, oldest), per status
+        windows = {
+            "Active": (0, 30),
+            "On Leave": (30, 90),
+            "Training": (0, 7),
+            "Inactive": (90, 365),
+        }
+        newest = np.empty(len(status), dtype=np.int64)
+        oldest = np.empty(len(status), dtype=np.int64)
+        for status_name, (days_newest, days_oldest) in windows.items():
+            in_status = status == status_name
+            newest[in_status] = days_newest
+            oldest[in_status] = days_oldest
+
+        days_back = self._rng.integers(newest, oldest + 1)
+        return _dates_from_ordinals(today_ordinal - days_back)
+
+    def _generate_names_bulk(self, gender, ethnicity):
+        """Generate Malaysian names for whole gender and ethnicity columns"""
+        names = np.empty(len(gender), dtype=object)
+
+        # Malay and Indian names: given name, patronymic particle, father's name
+        patronymic_patterns = {
+            ("Malay", "Male"): (self.malay_male_names, ["bin", "b."]),
+            ("Malay", "Female"): (self.malay_female_names, ["binti", "bt."]),
+            ("Indian", "Male"): (self.indian_male_names, ["s/o", "a/l"]),
+            ("Indian", "Female"): (self.indian_female_names, ["d/o", "a/p"]),
+        }
+        for (group, sex), (given_names, particles) in patronymic_patterns.items():
+            rows = (ethnicity == group) & (gender == sex)
+            count = int(rows.sum())
+            father_names = (
+                self.malay_male_names if group == "Malay" else self.indian_male_names
+            )
+            names[rows] = (
+                self._choose(given_names, count)
+                + " "
+                + self._choose(particles, count)
+                + " "
+                + self._choose(father_names, count)
             )
-            return f"{family_name} {name}"
-
-        elif ethnicity == "Indian":
-            if gender == "Male":
-                first_name = random.choice(self.indian_male_names)
-                last_name = (
-                    random.choice(["s/o", "a/l"])
-                    + " "
-                    + random.choice(self.indian_male_names)
-                )
-            else:
-                first_name = random.choice(self.indian_female_names)
-                last_name = (
-                    random.choice(["d/o", "a/p"])
-                    + " "
-                    + random.choice(self.indian_male_names)
-                )
-            return f"{first_name} {last_name}"
 
-        else:  # Indigenous or Others
-            # Use faker for other ethnicities
-            return self.fake.name()
+        # Chinese names: family name followed by given name
+        family_names = ["Lim", "Tan", "Lee", "Ong", "Ng", "Wong", "Teh", "Chan"]
+        for sex, given_names in (
+            ("Male", self.chinese_male_names),
+            ("Female", self.chinese_female_names),
+        ):
+            rows = (ethnicity == "Chinese") & (gender == sex)
+            count = int(rows.sum())
+            names[rows] = (
+                self._choose(family_names, count)
+                + " "
+                + self._choose(given_names, count)
+            )
 
-    def _generate_realistic_email(self, full_name):
-        """Generate realistic email addresses based on name"""
-        # Clean the name for email generation
-        name_parts = (
-            full_name.lower()
-            .replace(" bin ", " ")
-            .replace(" binti ", " ")
-            .replace(" bt. ", " ")
-            .replace(" b. ", " ")
-            .replace(" s/o ", " ")
-            .replace(" a/l ", " ")
-            .replace(" d/o ", " ")
-            .replace(" a/p ", " ")
-            .split()
-        )
-
-        # Common email patterns
-        patterns = [
-            f"{name_parts[0]}.{name_parts[-1]}",
-            f"{name_parts[0]}{name_parts[-1]}",
-            f"{name_parts[0]}.{name_parts[-1]}{random.randint(1, 99)}",
-            f"{name_parts[0][0]}.{name_parts[-1]}",
-            f"{name_parts[0]}.{name_parts[-1][0]}",
-        ]
+        # Indigenous or Others: use faker names
+        rows = ethnicity == "Others"
+        names[rows] = self._sample_faker_pool("name", int(rows.sum()))
 
-        # Malaysian email providers
-        providers = [
-            "gmail.com",
-            "hotmail.com",
-            "yahoo.com",
-            "outlook.com",
-            "rela.gov.my",
-        ]
-        weights = [40, 20, 15, 10, 15]  # rela.gov.my for official use
+        return names
 
-        pattern = random.choice(patterns)
-        provider = random.choices(providers, weights=weights, k=1)[0]
+    def _generate_emails_bulk(self, full_name):
+        """Generate realistic email addresses for a whole column of names"""
+        # Clean the names for email generation
+        name_parts = (
+            pd.Series(full_name, dtype=object)
+            .str.lower()
+            .str.replace(_NAME_PARTICLES, " ", regex=True)
+            .str.split()
+        )
+        first = name_parts.str[0].to_numpy(object)
+        last = name_parts.str[-1].to_numpy(object)
+        initial = name_parts.str[0].str[0].to_numpy(object)
+        last_initial = name_parts.str[-1].str[0].to_numpy(object)
+
+        # Common email patterns, one picked per row
+        size = len(first)
+        pattern = self._rng.integers(0, 5, size)
+        number = self._rng.integers(1, 100, size).astype(str).astype(object)
+        local = np.select(
+            [pattern == 0, pattern == 1, pattern == 2, pattern == 3],
+            [
+                first + "." + last,
+                first + last,
+                first + "." + last + number,
+                initial + "." + last,
+            ],
+            default=first + "." + last_initial,
+        )
 
         # Clean pattern (remove special characters, limit length)
-        pattern = "".join(c for c in pattern if c.isalnum() or c == ".")
-        pattern = pattern[:20]  # Limit length
+        local = (
+            pd.Series(local, dtype=object)
+            .str.replace(_EMAIL_STRIP, "", regex=True)
+            .str[:20]
+        )
 
-        return f"{pattern}@{provider}"
+        provider = pd.Series(
+            self._choose(self.email_providers, size, self._email_provider_probs),
+            dtype=object,
+        )
+        return local.str.cat(provider, sep="@").to_numpy(object)
 
-    def _generate_realistic_training(self, years_service, rank):
-        """Generate realistic training count based on service years and rank"""
-        base_training = max(
-            1, int(years_service * 1.5)
+    def _generate_training_bulk(self, years_service, rank_idx):
+        """Generate realistic training counts from service years and rank codes"""
+        base_training = np.maximum(
+            1, (years_service * 1.5).astype(np.int64)
         )  # 1.5 training per year on average
 
-        # Rank multiplier (higher ranks tend to have more training)
-        rank_multiplier = {
-            "Volunteer": 1.0,
-            "Senior Volunteer": 1.2,
-            "Team Leader": 1.5,
-            "Squad Leader": 1.8,
-            "Platoon Commander": 2.2,
-            "Company Commander": 2.5,
-            "Battalion Commander": 3.0,
-            "District Commander": 3.5,
-            "State Commander": 4.0,
-        }
+        training_count = (
+            base_training
+            * _RANK_TRAINING_MULTIPLIER[rank_idx]
+            * self._rng.uniform(0.8, 1.2, len(rank_idx))
+        ).astype(np.int64)
+
+        return np.clip(training_count, 1, 50)  # Reasonable limits
+
+    def _generate_operations_count_bulk(self, years_service, status):
+        """Generate realistic operations participation counts for whole columns"""
+        n = len(status)
+
+        # Draw every status arm for all rows, then keep each row's own arm.
+        # Members who are not active: uniform up to a status-dependent yearly rate
+        inactive_ops, on_leave_ops, training_ops = (
+            self._rng.integers(
+                0, np.maximum(1, (years_service * per_year).astype(np.int64)) + 1
+            )
+            for per_year in (2, 4, 3)
+        )
 
-        multiplier = rank_multiplier.get(rank, 1.0)
-        training_count = int(base_training * multiplier * random.uniform(0.8, 1.2))
-
-        return max(1, min(training_count, 50))  # Reasonable limits
-
-    def _generate_realistic_operations_count(self, years_service, status):
-        """Generate realistic operations participation count"""
-        if status == "Inactive":
-            return random.randint(0, max(1, int(years_service * 2)))
-        elif status == "On Leave":
-            return random.randint(0, max(1, int(years_service * 4)))
-        elif status == "Training":
-            return random.randint(0, max(1, int(years_service * 3)))
-        else:  # Active
-            base_ops = int(
-                years_service * 6
-            )  # 6 operations per year average for active members
-            return max(0, int(base_ops * random.uniform(0.5, 1.5)))
-
-    def _generate_realistic_commendations(self, years_service, rank):
-        """Generate realistic commendations based on service and rank"""
+        # Active members average 6 operations per year
+        base_ops = (years_service * 6).astype(np.int64)
+        active_ops = np.maximum(
+            0, (base_ops * self._rng.uniform(0.5, 1.5, n)).astype(np.int64)
+        )
+
+        return np.select(
+            [status == "Inactive", status == "On Leave", status == "Training"],
+            [inactive_ops, on_leave_ops, training_ops],
+            default=active_ops,
+        )
+
+    def _generate_commendations_bulk(self, years_service, rank_idx):
+        """Generate realistic commendations from service years and rank codes"""
         # Base chance increases with service years
-        base_chance = min(years_service * 0.05, 0.3)  # Max 30% chance
-
-        # Rank bonus
-        rank_bonus = {
-            "Volunteer": 0,
-            "Senior Volunteer": 0.02,
-            "Team Leader": 0.05,
-            "Squad Leader": 0.08,
-            "Platoon Commander": 0.12,
-            "Company Commander": 0.15,
-            "Battalion Commander": 0.20,
-            "District Commander": 0.25,
-            "State Commander": 0.30,
-        }
+        base_chance = np.minimum(years_service * 0.05, 0.3)  # Max 30% chance
 
-        final_chance = base_chance + rank_bonus.get(rank, 0)
+        final_chance = base_chance + _RANK_COMMENDATION_BONUS[rank_idx]
 
-        # Generate commendations
-        commendations = 0
-        for year in range(int(years_service)):
-            if random.random() < final_chance:
-                commendations += 1
+        # One Bernoulli trial per full service year
+        commendations = self._rng.binomial(years_service.astype(np.int64), final_chance)
 
-        return min(commendations, 10)  # Reasonable maximum
+        return np.minimum(commendations, 10)  # Reasonable maximum
 
-    def generate_all_data(
-        self, members_count=50000, operations_count=5000, assignments_count=20000
+    def build_all_data(
+        self,
+        members_count=50000,
+        operations_count=5000,
+        assignments_count=20000,
+        n_jobs=None,
     ):
-        """Generate all datasets and save to files"""
-        import os
-        import json
-        from datetime import datetime
+        """Generate all datasets in memory without writing anything to disk
 
+        Members and operations are independent, so for large datasets the
+        operations are generated in a worker process while members are built.
+        That worker counts towards `n_jobs`, so members get one worker fewer.
+        Assignments depend on the members and are generated afterwards.
+        """
         print("🔄 Generating complete RELA Malaysia Analytics dataset...")
 
-        # Generate all data
-        members_df = self.generate_members_data(members_count)
-        operations_df = self.generate_operations_data(operations_count)
+        n_jobs = n_jobs or os.cpu_count() or 1
+        operations_seed = self._seed_sequence.spawn(1)[0]
+        if n_jobs > 1 and members_count >= PARALLEL_MIN_MEMBERS:
+            with ProcessPoolExecutor(1) as executor:
+                operations_future = executor.submit(
+                    _generate_operations, operations_count, operations_seed
+                )
+                members_df = self.generate_members_data(
+                    members_count, max(1, n_jobs - 1)
+                )
+                operations_df = operations_future.result()
+        else:
+            members_df = self.generate_members_data(members_count, n_jobs)
+            operations_df = _generate_operations(operations_count, operations_seed)
+
         assignments_df = self.generate_assignments_data(members_df, assignments_count)
 
+        print(f"📊 Members: {len(members_df):,}")
+        print(f"🚀 Operations: {len(operations_df):,}")
+        print(f"📋 Assignments: {len(assignments_df):,}")
+
+        return members_df, operations_df, assignments_df
+
+    def persist(self, members_df, operations_df, assignments_df, data_dir="data"):
+        """Save generated datasets and their metadata to `data_dir`"""
         # Create data directory if it doesn't exist
-        os.makedirs("data", exist_ok=True)
+        os.makedirs(data_dir, exist_ok=True)
 
-        # Save CSV files
-        members_df.to_csv("data/members.csv", index=False)
-        operations_df.to_csv("data/operations.csv", index=False)
-        assignments_df.to_csv("data/assignments.csv", index=False)
+        # Save data files
+        frames = {
+            "members": members_df,
+            "operations": operations_df,
+            "assignments": assignments_df,
+        }
+        write_frames(
+            {
+                os.path.join(data_dir, f"{name}.{DATA_FILE_FORMAT}"): df
+                for name, df in frames.items()
+            }
+        )
 
         # Save metadata
         metadata = {
@@ -954,15 +1267,23 @@ class DataGenerator:
             "version": "2.0",
         }
 
-        with open("data/metadata.json", "w") as f:
-            json.dump(metadata, f, indent=2)
+        write_metadata(metadata, os.path.join(data_dir, "metadata.json"))
 
-        print(f"✅ Complete dataset generated and saved!")
-        print(f"📊 Members: {len(members_df):,}")
-        print(f"🚀 Operations: {len(operations_df):,}")
-        print(f"📋 Assignments: {len(assignments_df):,}")
+        print(f"✅ Complete dataset saved to {data_dir}/")
 
-        return members_df, operations_df, assignments_df
+    def generate_all_data(
+        self,
+        members_count=50000,
+        operations_count=5000,
+        assignments_count=20000,
+        n_jobs=None,
+    ):
+        """Generate all datasets and save to files"""
+        frames = self.build_all_data(
+            members_count, operations_count, assignments_count, n_jobs
+        )
+        self.persist(*frames)
+        return frames
 
 
 if __name__ == "__main__":
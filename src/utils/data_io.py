@@ -0,0 +1,85 @@
+import pandas as pd
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pa = pq = None
+    PYARROW_AVAILABLE = False
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Saved datasets are zstd-compressed Parquet when pyarrow is available, else CSV
+DATA_FILE_FORMAT = "parquet" if PYARROW_AVAILABLE else "csv"
+
+
+def _require_pyarrow():
+    """Raise a helpful error when a pyarrow-only feature is used without it"""
+    if not PYARROW_AVAILABLE:
+        raise ImportError(
+            "pyarrow not installed. Please install with: pip install pyarrow"
+        )
+
+
+def write_frame(df, path):
+    """Write a dataset to Parquet or CSV, depending on the path's extension"""
+    if path.endswith(".parquet"):
+        df.to_parquet(path, engine="pyarrow", compression="zstd", index=False)
+    else:
+        df.to_csv(path, index=False)
+
+
+def write_frames(frames):
+    """Write several datasets concurrently, given as a {path: DataFrame} mapping"""
+    with ThreadPoolExecutor(max_workers=len(frames) or 1) as executor:
+        futures = [
+            executor.submit(write_frame, df, path) for path, df in frames.items()
+        ]
+        for future in futures:
+            future.result()  # Re-raise any write error
+
+
+def read_frame(path):
+    """Read a dataset written by `write_frame`"""
+    if path.endswith(".parquet"):
+        return pd.read_parquet(path, engine="pyarrow")
+    return pd.read_csv(path)
+
+
+def write_metadata(metadata, path):
+    """Write a metadata dict as indented JSON, encoded by orjson when available
+
+    The document is encoded in full and handed to the buffered file in one write.
+    """
+    if ORJSON_AVAILABLE:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w") as f:
+            f.write(json.dumps(metadata, indent=2))
+
+
+def dump_to_duckdb(conn, table, batches):
+    """Append DataFrame batches to a DuckDB table, creating it if needed"""
+    rows = 0
+    for i, batch in enumerate(batches):
+        if i == 0:
+            conn.register("incoming_batch", batch)
+            conn.execute(
+                f'CREATE TABLE IF NOT EXISTS "{table}" AS '
+                "SELECT * FROM incoming_batch LIMIT 0"
+            )
+            conn.unregister("incoming_batch")
+        conn.append(table, batch)
+        rows += len(batch)
+    print(f"✅ Appended {rows:,} rows to DuckDB table {table}")
+    return rows
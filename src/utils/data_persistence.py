@@ -3,14 +3,15 @@ import os
 import json
 from datetime import datetime
 from .data_generator import DataGenerator
+from .data_io import DATA_FILE_FORMAT, read_frame, write_frames, write_metadata
 
 
 class DataPersistence:
     def __init__(self):
         self.data_dir = "data"
-        self.members_file = "members.csv"
-        self.operations_file = "operations.csv"
-        self.assignments_file = "assignments.csv"
+        self.members_file = f"members.{DATA_FILE_FORMAT}"
+        self.operations_file = f"operations.{DATA_FILE_FORMAT}"
+        self.assignments_file = f"assignments.{DATA_FILE_FORMAT}"
         self.metadata_file = "metadata.json"
 
         # Create data directory if it doesn't exist
@@ -34,14 +35,18 @@ class DataPersistence:
         )
 
     def save_data(self, members_df, operations_df, assignments_df):
-        """Save all dataframes to CSV files with metadata"""
+        """Save all dataframes to Parquet (or CSV) files with metadata"""
         paths = self.get_file_paths()
 
         try:
             # Save dataframes
-            members_df.to_csv(paths["members"], index=False)
-            operations_df.to_csv(paths["operations"], index=False)
-            assignments_df.to_csv(paths["assignments"], index=False)
+            write_frames(
+                {
+                    paths["members"]: members_df,
+                    paths["operations"]: operations_df,
+                    paths["assignments"]: assignments_df,
+                }
+            )
 
             # Save metadata
             metadata = {
@@ -52,8 +57,7 @@ class DataPersistence:
                 "version": "1.0",
             }
 
-            with open(paths["metadata"], "w") as f:
-                json.dump(metadata, f, indent=2)
+            write_metadata(metadata, paths["metadata"])
 
             return True
         except Exception as e:
@@ -61,13 +65,13 @@ class DataPersistence:
             return False
 
     def load_data(self):
-        """Load all dataframes from CSV files"""
+        """Load all dataframes from Parquet (or CSV) files"""
         paths = self.get_file_paths()
 
         try:
-            members_df = pd.read_csv(paths["members"])
-            operations_df = pd.read_csv(paths["operations"])
-            assignments_df = pd.read_csv(paths["assignments"])
+            members_df = read_frame(paths["members"])
+            operations_df = read_frame(paths["operations"])
+            assignments_df = read_frame(paths["assignments"])
 
             # Convert date columns back to datetime
             members_df["join_date"] = pd.to_datetime(members_df["join_date"])
@@ -77,11 +81,19 @@ class DataPersistence:
                 assignments_df["assignment_date"]
             )
 
+            members_df, operations_df = self.prepare_frames(members_df, operations_df)
+
             return members_df, operations_df, assignments_df
         except Exception as e:
             print(f"Error loading data: {e}")
             return None, None, None
 
+    def prepare_frames(self, members_df, operations_df):
+        """Store repeated label columns as categoricals for cheaper aggregations"""
+        members_df = members_df.astype({"state": "category", "status": "category"})
+        operations_df = operations_df.astype({"operation_type": "category"})
+        return members_df, operations_df
+
     def get_metadata(self):
         """Get metadata about the saved data"""
         paths = self.get_file_paths()
@@ -93,20 +105,22 @@ class DataPersistence:
             return None
 
     def generate_and_save_data(
-        self, members_count=50000, operations_count=5000, assignments_count=20000
+        self,
+        members_count=50000,
+        operations_count=5000,
+        assignments_count=20000,
+        seed=None,
     ):
-        """Generate new data and save it"""
-        data_gen = DataGenerator()
-
-        print(f"Generating {members_count:,} members...")
-        members_df = data_gen.generate_members_data(members_count)
+        """Generate new data and save it
 
-        print(f"Generating {operations_count:,} operations...")
-        operations_df = data_gen.generate_operations_data(operations_count)
+        With a seed the generated values do not depend on the host or its CPU
+        count; only timestamps and dates follow the current time.
+        """
+        data_gen = DataGenerator(seed=seed)
 
-        print(f"Generating {assignments_count:,} assignments...")
-        assignments_df = data_gen.generate_assignments_data(
-            members_df, assignments_count
+        # Each dataset draws from its own child stream of the seed
+        members_df, operations_df, assignments_df = data_gen.build_all_data(
+            members_count, operations_count, assignments_count
         )
 
         print("Saving data to files...")
@@ -114,6 +128,7 @@ class DataPersistence:
 
         if success:
             print("Data generated and saved successfully!")
+            members_df, operations_df = self.prepare_frames(members_df, operations_df)
             return members_df, operations_df, assignments_df
         else:
             print("Failed to save data!")
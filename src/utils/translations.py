@@ -3,6 +3,10 @@ Translations for RELA Malaysia Dashboard
 Supports English and Malay languages
 """
 
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+
 translations = {
     "en": {
         # Main Header
@@ -39,19 +43,19 @@ translations = {
         "about_rela": "About RELA Malaysia",
         "about_description": "The People's Volunteer Corps (RELA) is Malaysia's largest civil volunteer organization with over 3 million members nationwide.",
         "core_functions": "Core Functions",
-        "core_functions_list": [
+        "core_functions_list": (
             "Security control and monitoring",
             "Emergency response operations",
             "Immigration assistance",
             "Community safety programs",
-        ],
+        ),
         "coverage": "Coverage",
-        "coverage_list": [
+        "coverage_list": (
             "All 13 states + 3 federal territories",
             "Urban and rural areas",
             "24/7 operations capability",
             "Multi-ethnic volunteer force",
-        ],
+        ),
         # KPI Labels
         "total_members": "👥 Total Members",
         "total_operations": "🚨 Total Operations",
@@ -490,19 +494,19 @@ translations = {
         "about_rela": "Mengenai RELA Malaysia",
         "about_description": "Pasukan Sukarelawan Rakyat (RELA) adalah organisasi sukarelawan sivil terbesar Malaysia dengan lebih 3 juta ahli di seluruh negara.",
         "core_functions": "Fungsi Utama",
-        "core_functions_list": [
+        "core_functions_list": (
             "Kawalan dan pemantauan keselamatan",
             "Operasi tindak balas kecemasan",
             "Bantuan imigresen",
             "Program keselamatan komuniti",
-        ],
+        ),
         "coverage": "Liputan",
-        "coverage_list": [
+        "coverage_list": (
             "Semua 13 negeri + 3 wilayah persekutuan",
             "Kawasan bandar dan luar bandar",
             "Keupayaan operasi 24/7",
             "Pasukan sukarelawan pelbagai kaum",
-        ],
+        ),
         # KPI Labels
         "total_members": "👥 Jumlah Ahli",
         "total_operations": "🚨 Jumlah Operasi",
@@ -856,10 +860,30 @@ translations = {
     },
 }
 
+# Freeze the tables into read-only views, with keys interned once at import
+translations = MappingProxyType(
+    {
+        language: MappingProxyType(
+            {sys.intern(key): text for key, text in table.items()}
+        )
+        for language, table in translations.items()
+    }
+)
+
+# Every entry keyed by (language, key), so a lookup is a single dict probe
+_FLAT_TRANSLATIONS = MappingProxyType(
+    {
+        (language, key): text
+        for language, table in translations.items()
+        for key, text in table.items()
+    }
+)
+
 
+@lru_cache(maxsize=4096)
 def get_text(language, key, default=""):
     """Get translated text for given language and key"""
-    return translations.get(language, {}).get(key, default or key)
+    return _FLAT_TRANSLATIONS.get((language, key), default or key)
 
 
 def get_language_options():
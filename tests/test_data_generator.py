@@ -0,0 +1,144 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.utils import data_generator
+from src.utils.data_generator import DataGenerator
+
+NUM_MEMBERS = 3000
+
+
+def _member_ids(count):
+    return [f"RELA{i:08d}" for i in range(1, count + 1)]
+
+
+def _stream(seed=7, num_members=NUM_MEMBERS, batch_size=700, n_jobs=1):
+    generator = DataGenerator(seed=seed)
+    return list(generator.generate_members_stream(num_members, batch_size, n_jobs))
+
+
+class _FrozenDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2025, 6, 15, 10, 30, 0, 250000)
+
+
+@pytest.fixture
+def frozen_now(monkeypatch):
+    """Pin the generator's clock so timestamp-derived columns are comparable"""
+    monkeypatch.setattr(data_generator, "datetime", _FrozenDatetime)
+
+
+def test_member_ids_are_contiguous_across_batches():
+    batches = _stream()
+    assert len(batches) == 5
+    members = pd.concat(batches, ignore_index=True)
+    assert members["member_id"].tolist() == _member_ids(NUM_MEMBERS)
+
+
+def test_member_ids_are_contiguous_across_parallel_chunks(monkeypatch):
+    monkeypatch.setattr(data_generator, "PARALLEL_MIN_MEMBERS", 1000)
+    members = DataGenerator(seed=7).generate_members_data(NUM_MEMBERS, n_jobs=2)
+    assert members["member_id"].tolist() == _member_ids(NUM_MEMBERS)
+
+
+def test_growth_buckets_follow_global_row_position():
+    members = pd.concat(_stream(), ignore_index=True)
+    years = members["years_of_service"].to_numpy(np.float64)
+    position = np.arange(NUM_MEMBERS)
+
+    # Founding, early growth, steady and expansion periods, by global position
+    for low, high, oldest, newest in [
+        (0.0, 0.15, 10, 8),
+        (0.15, 0.35, 8, 6),
+        (0.35, 0.55, 6, 4),
+        (0.55, 0.75, 4, 2),
+    ]:
+        bucket = years[
+            (position >= low * NUM_MEMBERS) & (position < high * NUM_MEMBERS)
+        ]
+        assert bucket.min() >= newest - 0.1
+        assert bucket.max() <= oldest + 0.1
+
+    # Recent growth: the last 25% joined within roughly the last two years
+    assert years[position >= 0.75 * NUM_MEMBERS].max() <= 2.1
+
+
+def test_seeded_runs_are_reproducible(frozen_now):
+    first = DataGenerator(seed=11).build_all_data(NUM_MEMBERS, 300, 1000)
+    second = DataGenerator(seed=11).build_all_data(NUM_MEMBERS, 300, 1000)
+    for a, b in zip(first, second):
+        pd.testing.assert_frame_equal(a, b)
+
+
+def test_seeded_streams_are_reproducible(frozen_now):
+    for a, b in zip(_stream(seed=5), _stream(seed=5)):
+        pd.testing.assert_frame_equal(a, b)
+
+
+def test_chunking_does_not_change_members(frozen_now, monkeypatch):
+    monkeypatch.setattr(data_generator, "MEMBER_CHUNK_SIZE", 700)
+    monkeypatch.setattr(data_generator, "PARALLEL_MIN_MEMBERS", 1000)
+
+    serial = DataGenerator(seed=9).generate_members_data(NUM_MEMBERS, n_jobs=1)
+    parallel = DataGenerator(seed=9).generate_members_data(NUM_MEMBERS, n_jobs=2)
+    pd.testing.assert_frame_equal(serial, parallel)
+
+    for batch_size in (1000, 450, 5000):
+        streamed = pd.concat(_stream(seed=9, batch_size=batch_size), ignore_index=True)
+        pd.testing.assert_frame_equal(serial, streamed)
+
+
+def test_all_datasets_do_not_depend_on_n_jobs(frozen_now, monkeypatch):
+    monkeypatch.setattr(data_generator, "MEMBER_CHUNK_SIZE", 700)
+    monkeypatch.setattr(data_generator, "PARALLEL_MIN_MEMBERS", 1000)
+
+    # n_jobs=2 moves operations into a worker process, n_jobs=3 also splits
+    # members across the two remaining workers
+    serial = DataGenerator(seed=13).build_all_data(NUM_MEMBERS, 300, 1000, n_jobs=1)
+    for n_jobs in (2, 3):
+        parallel = DataGenerator(seed=13).build_all_data(
+            NUM_MEMBERS, 300, 1000, n_jobs=n_jobs
+        )
+        for a, b in zip(serial, parallel):
+            pd.testing.assert_frame_equal(a, b)
+
+
+def test_different_seeds_differ():
+    a = DataGenerator(seed=1).generate_members_data(500)
+    b = DataGenerator(seed=2).generate_members_data(500)
+    assert not a["full_name"].equals(b["full_name"])
+
+
+def test_dtypes_and_categories_survive_concat(frozen_now, monkeypatch):
+    monkeypatch.setattr(data_generator, "MEMBER_CHUNK_SIZE", 700)
+
+    # Five generated chunks concatenated in one call, against the same
+    # chunks re-sliced into batches that straddle chunk boundaries
+    chunked = DataGenerator(seed=3).generate_members_data(NUM_MEMBERS)
+    batched = pd.concat(_stream(seed=3, batch_size=400), ignore_index=True)
+    pd.testing.assert_frame_equal(chunked, batched)
+
+    generator = DataGenerator()
+    for column, dtype in generator._member_categories.items():
+        assert batched[column].dtype == dtype
+        assert list(batched[column].cat.categories) == list(dtype.categories)
+    assert batched["age"].dtype == np.int8
+    assert batched["years_of_service"].dtype == np.float32
+
+
+@pytest.mark.parametrize(
+    "build",
+    [
+        lambda g: g.generate_members_data(0),
+        lambda g: g.generate_operations_data(0),
+        lambda g: g.generate_assignments_data(g.generate_members_data(500), 0),
+    ],
+    ids=["members", "operations", "assignments"],
+)
+def test_zero_rows_give_empty_frames(build):
+    df = build(DataGenerator(seed=1))
+    assert df.empty
+    assert len(df.columns) > 0
@@ -0,0 +1,87 @@
+import pytest
+
+pytest.importorskip("streamlit")
+pytest.importorskip("dotenv")
+
+from types import SimpleNamespace
+
+from src.core.floating_chatbot import (
+    _ANSWER_MARKER,
+    FloatingChatbot,
+    _split_batch_answers,
+)
+
+
+def _reply(*answers):
+    return "\n".join(
+        f"{_ANSWER_MARKER.format(i)}\n{answer}" for i, answer in enumerate(answers, 1)
+    )
+
+
+class _FakeCompletions:
+    def __init__(self, replies):
+        self.replies = list(replies)
+        self.calls = 0
+
+    def create(self, **kwargs):
+        self.calls += 1
+        reply = self.replies.pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+        message = SimpleNamespace(content=reply)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def _chatbot(*replies):
+    chatbot = FloatingChatbot.__new__(FloatingChatbot)
+    chatbot.language = "en"
+    chatbot.model = "test-model"
+    completions = _FakeCompletions(replies)
+    chatbot.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return chatbot, completions
+
+
+def test_split_batch_answers_in_order():
+    reply = _reply("There are 50,000 members.", "Selangor has the most members.")
+    assert _split_batch_answers(reply, 2) == [
+        "There are 50,000 members.",
+        "Selangor has the most members.",
+    ]
+
+
+def test_split_batch_answers_keeps_nested_numbered_lists():
+    first = "1. Key metrics look healthy\n2. Attendance is above 90%"
+    second = (
+        "The top states are:\n1. Selangor (8,000)\n2. Johor (6,500)\n3. Perak (4,000)"
+    )
+    assert _split_batch_answers(_reply(first, second), 2) == [first, second]
+
+
+def test_split_batch_answers_rejects_plain_numbering():
+    reply = "1. Key metrics...\n2. The top states are:\n1. Selangor\n2. Johor"
+    assert _split_batch_answers(reply, 2) is None
+
+
+def test_split_batch_answers_rejects_missing_or_extra_answers():
+    assert _split_batch_answers(_reply("Only one answer."), 2) is None
+    assert _split_batch_answers(_reply("One.", "Two.", "Three."), 2) is None
+
+
+def test_split_batch_answers_rejects_out_of_order_or_empty_answers():
+    swapped = f"{_ANSWER_MARKER.format(2)}\nB\n{_ANSWER_MARKER.format(1)}\nA"
+    assert _split_batch_answers(swapped, 2) is None
+    assert _split_batch_answers(_reply("A", ""), 2) is None
+
+
+def test_batch_answer_reports_a_failed_request_once_per_question():
+    chatbot, completions = _chatbot(ConnectionError("connection refused"))
+    answers = chatbot._batch_answer(["Q1", "Q2", "Q3"], "context")
+    assert completions.calls == 1
+    assert len(answers) == 3
+    assert all("connection refused" in answer for answer in answers)
+
+
+def test_batch_answer_retries_each_question_after_a_malformed_reply():
+    chatbot, completions = _chatbot("1. A\n2. B", "A", "B")
+    assert chatbot._batch_answer(["Q1", "Q2"], "context") == ["A", "B"]
+    assert completions.calls == 3
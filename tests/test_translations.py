@@ -0,0 +1,29 @@
+import pytest
+
+from src.utils.translations import get_language_options, get_text, translations
+
+
+def test_languages_share_the_same_keys():
+    assert set(translations["en"]) == set(translations["ms"])
+
+
+def test_get_text_returns_the_translation():
+    assert get_text("en", "no_data") == translations["en"]["no_data"]
+    assert get_text("ms", "no_data") == "Tiada data tersedia."
+
+
+def test_get_text_falls_back_to_default_then_key():
+    assert get_text("en", "missing_key", "Fallback") == "Fallback"
+    assert get_text("en", "missing_key") == "missing_key"
+    assert get_text("xx", "no_data") == "no_data"
+
+
+def test_list_entries_are_immutable():
+    functions = get_text("en", "core_functions_list")
+    assert isinstance(functions, tuple) and functions
+    with pytest.raises(TypeError):
+        translations["en"]["no_data"] = "changed"
+
+
+def test_language_options_map_to_known_languages():
+    assert set(get_language_options().values()) <= set(translations)